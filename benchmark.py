@@ -0,0 +1,355 @@
+"""
+Benchmark suite for the motion engine and the renderers.
+Three suites, each reporting one number per case:
+
+- engine: MotionEngine.step throughput in mover-steps per second, 1 to 1M movers
+- render: the desktop app's per-frame work (occupancy update plus the swarm
+  canvas draw) against a stub canvas, so no display or Xvfb is needed
+- sketch: the p5 sketch's draw() per shape, run under Node with the p5 and DOM
+  calls stubbed out (skipped when node is not on PATH)
+
+Results are written as JSON with machine metadata and can be compared with a
+stored baseline; any case slower than the threshold fails the run:
+
+    python benchmark.py --out baseline.json
+    python benchmark.py --baseline baseline.json --threshold 0.15
+"""
+
+import argparse
+import ast
+import datetime
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from canvas_renderer import CanvasSwarmRenderer
+from engine import MotionEngine, playfield_bounds
+from export import SHAPES
+from occupancy import OccupancyGrid
+from scheduler import SIM_STEP
+
+SUITES = ("engine", "render", "sketch")
+ENGINE_COUNTS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+RENDER_COUNTS = (1, 100, 1000, 5000)
+SKETCH_COUNTS = (1, 1000, 10000)
+SKETCH_FRAMES = 120
+SCREEN = (1920, 1080)
+DOT_SIZE = 24
+MIN_TIME_S = 0.5
+ROUNDS = 5
+THRESHOLD = 0.10
+NODE_TIMEOUT_S = 300
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+app_path = os.path.join(base_dir, "streamlit_app.py")
+
+
+def _bounds():
+    return playfield_bounds(SCREEN[0], SCREEN[1], DOT_SIZE)
+
+
+def time_call(fn, min_time=MIN_TIME_S, rounds=ROUNDS):
+    """Median seconds per call of ``fn`` over ``rounds`` rounds lasting min_time in total."""
+    per_round = min_time / rounds
+    samples = []
+    for _ in range(rounds):
+        calls = 0
+        t0 = time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            spent = time.perf_counter() - t0
+            if spent >= per_round:
+                break
+        samples.append(spent / calls)
+    return statistics.median(samples)
+
+
+def _case(suite, name, count, value, unit, higher_is_better):
+    return {
+        "key": f"{suite}.{name}/{count}",
+        "suite": suite,
+        "name": name,
+        "count": count,
+        "value": value,
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+def bench_engine(counts=ENGINE_COUNTS, min_time=MIN_TIME_S):
+    """Fixed-step throughput of the headless engine the desktop app runs."""
+    cases = []
+    for n in counts:
+        engine = MotionEngine(count=n, seed=0)
+        engine.set_bounds(*_bounds())
+        engine.start_idle()
+        # Run past the first pauses so most movers are travelling.
+        for _ in range(60):
+            engine.step(SIM_STEP)
+        seconds = time_call(lambda: engine.step(SIM_STEP), min_time)
+        cases.append(_case("engine", "step", n, n / seconds, "mover-steps/s", True))
+    return cases
+
+
+class StubCanvas:
+    """Just enough of tk.Canvas for CanvasSwarmRenderer; Tcl scripts are built but not run."""
+
+    def __init__(self):
+        self.tk = self
+        self.next_id = 1
+        self.script_bytes = 0
+
+    def __str__(self):
+        return ".!canvas"
+
+    def create_oval(self, *args, **kwargs):
+        self.next_id += 1
+        return self.next_id - 1
+
+    def delete(self, item):
+        pass
+
+    def itemconfigure(self, tag, **kwargs):
+        pass
+
+    def eval(self, script):
+        self.script_bytes += len(script)
+
+
+def bench_render(counts=RENDER_COUNTS, min_time=MIN_TIME_S):
+    """Per-frame cost of frame_step's drawing work in swarm mode, minus Tk itself."""
+    cases = []
+    for n in counts:
+        engine = MotionEngine(count=n, seed=0)
+        engine.set_bounds(*_bounds())
+        engine.start_idle()
+        for _ in range(60):
+            engine.step(SIM_STEP)
+        renderer = CanvasSwarmRenderer(StubCanvas(), "#1f6aa5")
+        renderer.set_count(n)
+        grid = OccupancyGrid(engine.max_x, engine.max_y)
+
+        def frame():
+            grid.add(engine.x, engine.y)
+            renderer.draw(engine.x, engine.y)
+
+        seconds = time_call(frame, min_time)
+        cases.append(_case("render", "frame", n, seconds * 1000.0, "ms/frame", False))
+    return cases
+
+
+# Stand-ins for the p5 globals and DOM calls the sketch makes. Drawing calls are
+# no-ops, so what is timed is the sketch's own JavaScript: simulation steps,
+# interpolation and the per-mover drawImage loop.
+SKETCH_PRELUDE = r"""
+const noop = () => {};
+const stubElement = () => new Proxy({ clientWidth: 1920, clientHeight: 1080, style: {},
+                                      classList: { toggle: noop, add: noop, remove: noop } },
+  { get: (t, k) => (k in t ? t[k] : noop) });
+const document = { getElementById: stubElement, querySelectorAll: () => [], addEventListener: noop,
+                   createElement: stubElement };
+const window = { innerWidth: 1920, innerHeight: 1080, devicePixelRatio: 1, parent: {} };
+setTimeout = () => 0;
+clearTimeout = noop;
+setInterval = () => 0;
+let drawImageCalls = 0;
+const context2d = (props) => new Proxy(props || {}, { get: (t, k) => (k in t ? t[k] : noop) });
+const drawingContext = context2d({ drawImage: () => { drawImageCalls++; } });
+class OffscreenCanvas {
+  constructor(w, h) { this.width = w; this.height = h; }
+  getContext() { return context2d(); }
+}
+function Path2D() { return context2d(); }
+const graphics = (w, h) => new Proxy({ width: w, height: h, elt: {}, drawingContext: {},
+                                       color: () => ({ setAlpha: noop }) },
+  { get: (t, k) => (k in t ? t[k] : noop) });
+let deltaTime = 1000 / 60;
+let windowWidth = 1920, windowHeight = 1080;
+let density = 1;
+let rngState = 1;
+const PI = Math.PI, TWO_PI = 2 * Math.PI, HALF_PI = Math.PI / 2, CLOSE = 'close', CENTER = 'center';
+const sqrt = Math.sqrt, sin = Math.sin, cos = Math.cos, pow = Math.pow, min = Math.min;
+const sq = (v) => v * v;
+const constrain = (v, lo, hi) => Math.max(lo, Math.min(hi, v));
+function random(lo, hi) {
+  rngState = (rngState * 1103515245 + 12345) % 2147483648;
+  return lo + (hi - lo) * (rngState / 2147483648);
+}
+const randomSeed = (s) => { rngState = s >>> 0 || 1; };
+const millis = () => performance.now();
+const pixelDensity = (d) => { if (d !== undefined) density = d; return density; };
+const displayDensity = () => 1;
+const createCanvas = () => ({ parent: noop });
+const createGraphics = graphics;
+const background = noop, push = noop, pop = noop, stroke = noop, strokeWeight = noop, noFill = noop,
+      rectMode = noop, rect = noop, frameRate = noop, noLoop = noop, loop = noop, noCanvas = noop,
+      resizeCanvas = noop;
+"""
+
+SKETCH_EPILOGUE = r"""
+const bench = __BENCH__;
+setup();
+running = true;
+for (const shape of bench.shapes) {
+  for (const count of bench.counts) {
+    config.shape = shape;
+    setMoverCount(count);
+    for (let i = 0; i < count; i++) pickNewMovement(i, simTime);
+    for (let i = 0; i < bench.warmup; i++) draw();
+    const samples = [];
+    for (let i = 0; i < bench.frames; i++) {
+      const t0 = performance.now();
+      draw();
+      samples.push(performance.now() - t0);
+    }
+    samples.sort((a, b) => a - b);
+    console.log(JSON.stringify({ shape, count, ms: samples[samples.length >> 1] }));
+  }
+}
+"""
+
+
+def sketch_source(path=app_path):
+    """The shared simulation and main-thread <script> blocks, with Python-side placeholders filled in."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    html = next(node.value.value for node in tree.body
+                if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+                and any(getattr(t, "id", None) == "html" for t in node.targets))
+    shared = re.search(r'<script id="sim-src">(.*?)</script>', html, re.S).group(1)
+    blocks = re.findall(r"<script>(.*?)</script>", html, re.S)
+    script = shared + next(b for b in blocks if "function draw()" in b)
+    for name, value in (("__SEED__", "1"), ("__WORKER__", "false"),
+                        ("__TELEMETRY__", "null"), ("__ENGINE__", "null"),
+                        ("__FPS_CAP__", "0")):
+        script = script.replace(name, value)
+    return script
+
+
+def bench_sketch(counts=SKETCH_COUNTS, shapes=SHAPES, frames=SKETCH_FRAMES, node=None):
+    """Median draw() time per shape under Node; an empty list when node is unavailable."""
+    node = node or shutil.which("node")
+    if node is None:
+        print("node not found; skipping the sketch suite", file=sys.stderr)
+        return []
+    bench = {"shapes": list(shapes), "counts": list(counts), "frames": frames, "warmup": frames // 4}
+    program = SKETCH_PRELUDE + sketch_source() + SKETCH_EPILOGUE.replace("__BENCH__", json.dumps(bench))
+    with tempfile.NamedTemporaryFile("w", suffix=".js", delete=False) as f:
+        f.write(program)
+    try:
+        out = subprocess.run([node, f.name], capture_output=True, text=True,
+                             timeout=NODE_TIMEOUT_S, check=True).stdout
+    finally:
+        os.unlink(f.name)
+    cases = []
+    for line in out.splitlines():
+        row = json.loads(line)
+        cases.append(_case("sketch", f"draw:{row['shape']}", row["count"], row["ms"], "ms/frame", False))
+    return cases
+
+
+def _command_output(cmd):
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=10, cwd=base_dir).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def machine_metadata(node=None):
+    node = node or shutil.which("node")
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "node": _command_output([node, "--version"]) if node else None,
+        "commit": _command_output(["git", "rev-parse", "--short", "HEAD"]),
+    }
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Rows of (key, baseline, current, change, regressed) for the cases both runs have.
+
+    ``change`` is the relative slowdown: positive is worse whichever way the unit points.
+    """
+    old = {c["key"]: c for c in baseline["cases"]}
+    rows = []
+    for case in results["cases"]:
+        ref = old.get(case["key"])
+        if ref is None or not ref["value"]:
+            continue
+        ratio = case["value"] / ref["value"]
+        change = 1.0 / ratio - 1.0 if case["higher_is_better"] else ratio - 1.0
+        rows.append((case["key"], ref["value"], case["value"], change, change > threshold))
+    return rows
+
+
+def run(suites=SUITES, min_time=MIN_TIME_S, max_count=None, frames=SKETCH_FRAMES, node=None):
+    def upto(counts):
+        return [n for n in counts if max_count is None or n <= max_count]
+
+    cases = []
+    if "engine" in suites:
+        cases += bench_engine(upto(ENGINE_COUNTS), min_time)
+    if "render" in suites:
+        cases += bench_render(upto(RENDER_COUNTS), min_time)
+    if "sketch" in suites:
+        cases += bench_sketch(upto(SKETCH_COUNTS), frames=frames, node=node)
+    return {"machine": machine_metadata(node), "cases": cases}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the motion engine and the renderers")
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--out", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with a previous --out file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="relative slowdown that counts as a regression (default 0.10)")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME_S, help="seconds of timing per case")
+    parser.add_argument("--max-count", type=int, help="skip cases with more movers than this")
+    parser.add_argument("--frames", type=int, default=SKETCH_FRAMES, help="timed draw() calls per sketch case")
+    parser.add_argument("--node", metavar="PATH", help="Node.js executable for the sketch suite")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args.suites, args.min_time, args.max_count, args.frames, args.node)
+    for case in results["cases"]:
+        print(f"{case['key']:<28} {case['value']:>14.4g} {case['unit']}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if not args.baseline:
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["machine"].get("platform") != results["machine"]["platform"] \
+            or baseline["machine"].get("processor") != results["machine"]["processor"]:
+        print("warning: the baseline was recorded on a different machine", file=sys.stderr)
+    rows = compare(results, baseline, args.threshold)
+    print(f"\n{'case':<28} {'baseline':>12} {'current':>12} {'change':>8}")
+    for key, old, new, change, regressed in rows:
+        print(f"{key:<28} {old:>12.4g} {new:>12.4g} {change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+    regressions = sum(r[4] for r in rows)
+    if regressions:
+        sys.exit(f"{regressions} case(s) regressed by more than {args.threshold:.0%}")
+    print(f"no regressions beyond {args.threshold:.0%} in {len(rows)} cases")
+
+
+if __name__ == "__main__":
+    main()
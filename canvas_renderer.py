@@ -0,0 +1,62 @@
+"""
+Raw tk.Canvas renderer for swarm mode.
+Each mover is a pre-created oval item; a frame is pushed to Tk as one Tcl
+script of ``coords`` commands instead of going through turtle's pipeline.
+"""
+
+import numpy as np
+
+SWARM_TAG = "swarm"
+BASE_RADIUS = 10.0  # turtle's "circle" shape at shapesize(1) is 20 px across
+
+
+class CanvasSwarmRenderer:
+    def __init__(self, canvas, color, size=1.0):
+        self.canvas = canvas
+        self.color = color
+        self.radius = BASE_RADIUS * size
+        self.items = []
+        self._ids = np.zeros(0, dtype=np.int64)
+
+    @property
+    def count(self):
+        return len(self.items)
+
+    def set_count(self, count):
+        """Create or delete canvas items so there is one per mover."""
+        count = max(int(count), 0)
+        while len(self.items) > count:
+            self.canvas.delete(self.items.pop())
+        while len(self.items) < count:
+            self.items.append(self.canvas.create_oval(
+                0, 0, 0, 0, fill=self.color, outline="", tags=(SWARM_TAG,)
+            ))
+        self._ids = np.asarray(self.items, dtype=np.int64)
+
+    def set_color(self, color):
+        self.color = color
+        if self.items:
+            self.canvas.itemconfigure(SWARM_TAG, fill=color)
+
+    def set_size(self, size):
+        self.radius = BASE_RADIUS * float(size)
+
+    def clear(self):
+        self.set_count(0)
+
+    def draw(self, x, y):
+        """Move every item to the given turtle-space positions in one Tcl call."""
+        n = min(self.count, len(x))
+        if n == 0:
+            return
+        r = self.radius
+        # Turtle space is y-up around the origin; canvas space is y-down.
+        cx = x[:n]
+        cy = -y[:n]
+        boxes = np.column_stack((cx - r, cy - r, cx + r, cy + r))
+        path = str(self.canvas)
+        script = "\n".join(
+            f"{path} coords {i} {b[0]:.1f} {b[1]:.1f} {b[2]:.1f} {b[3]:.1f}"
+            for i, b in zip(self._ids[:n].tolist(), boxes.tolist())
+        )
+        self.canvas.tk.eval(script)
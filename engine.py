@@ -0,0 +1,234 @@
+"""
+Headless motion engine for the random moving dot.
+Holds any number of movers as NumPy arrays and advances all of them in one
+vectorized step, with the same pick / pause / redirect-to-center rules as the
+original per-turtle loop in main.py. advance() applies those rules event by
+event with analytic wall hits, for fast-forwarding long stretches of time; it
+stops movers on the wall rather than one step past it, so its paths differ.
+No Tk or turtle imports.
+"""
+
+import numpy as np
+
+SPEED = 180.0
+PAUSE_ON_TURN = 0.35
+MIN_DISTANCE = 100
+MAX_DISTANCE = 600
+REDIRECT_STEP = 150
+EDGE_MARGIN = 15
+
+
+def playfield_bounds(width, height, size=0.0, margin=EDGE_MARGIN):
+    """Half-extents for mover centres on a ``width`` x ``height`` screen.
+
+    Every dot of diameter ``size`` stays ``margin`` pixels clear of the edges.
+    The desktop app, the sketch and the headless tools all use this rule.
+    """
+    offset = margin + size / 2.0
+    return width / 2.0 - offset, height / 2.0 - offset
+
+
+class MotionEngine:
+    def __init__(self, count=1, speed=SPEED, pause=PAUSE_ON_TURN,
+                 min_distance=MIN_DISTANCE, max_distance=MAX_DISTANCE,
+                 redirect_step=REDIRECT_STEP, seed=None):
+        self.speed = float(speed)
+        self.pause = float(pause)
+        self.min_distance = float(min_distance)
+        self.max_distance = float(max_distance)
+        self.redirect_step = float(redirect_step)
+
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.time = 0.0
+        self.max_x = 0.0
+        self.max_y = 0.0
+
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.heading = np.zeros(0)
+        self.ux = np.zeros(0)
+        self.uy = np.zeros(0)
+        self.remaining = np.zeros(0)
+        self.paused_until = np.zeros(0)
+        self.redirecting = np.zeros(0, dtype=bool)
+        # Movers that began a new segment since a recorder last consumed them.
+        self.segment_started = np.zeros(0, dtype=bool)
+        self.resize(count)
+
+    @property
+    def count(self):
+        return self.x.shape[0]
+
+    def resize(self, count):
+        """Grow or shrink the population; new movers start idle at the center."""
+        count = max(int(count), 0)
+        old = self.count
+        if count == old:
+            return
+        keep = min(old, count)
+
+        def fit(arr, fill):
+            out = np.full(count, fill, dtype=arr.dtype)
+            out[:keep] = arr[:keep]
+            return out
+
+        self.x = fit(self.x, 0.0)
+        self.y = fit(self.y, 0.0)
+        self.heading = fit(self.heading, 0.0)
+        self.ux = fit(self.ux, 1.0)
+        self.uy = fit(self.uy, 0.0)
+        self.remaining = fit(self.remaining, 0.0)
+        self.paused_until = fit(self.paused_until, 0.0)
+        self.redirecting = fit(self.redirecting, False)
+        self.segment_started = fit(self.segment_started, False)
+
+    def set_bounds(self, max_x, max_y):
+        """Set the half-extents of the playfield and clamp movers inside it."""
+        self.max_x = max(float(max_x), 0.0)
+        self.max_y = max(float(max_y), 0.0)
+        np.clip(self.x, -self.max_x, self.max_x, out=self.x)
+        np.clip(self.y, -self.max_y, self.max_y, out=self.y)
+
+    def reset(self, idx=None):
+        """Put movers back at the center with no pending movement."""
+        sel = slice(None) if idx is None else idx
+        self.x[sel] = 0.0
+        self.y[sel] = 0.0
+        self.remaining[sel] = 0.0
+        self.paused_until[sel] = 0.0
+        self.redirecting[sel] = False
+
+    def end_pauses(self):
+        """Release every mover that is currently waiting after a turn."""
+        np.minimum(self.paused_until, self.time, out=self.paused_until)
+
+    def set_heading(self, mask, degrees):
+        """Point the masked movers along ``degrees`` and cache the unit vector."""
+        self.heading[mask] = degrees
+        rad = np.radians(degrees)
+        self.ux[mask] = np.cos(rad)
+        self.uy[mask] = np.sin(rad)
+
+    def needs_movement(self):
+        return self.remaining <= 0
+
+    def _pause_end(self, mask, now):
+        # ``now`` is either None (the engine clock) or a per-mover time array.
+        return (self.time if now is None else now[mask]) + self.pause
+
+    def start_random(self, mask, now=None):
+        """Give the masked movers a fresh random heading and distance."""
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return
+        self.set_heading(mask, self.rng.uniform(0.0, 360.0, n))
+        self.remaining[mask] = self.rng.uniform(self.min_distance, self.max_distance, n)
+        self.paused_until[mask] = self._pause_end(mask, now)
+        self.redirecting[mask] = False
+        self.segment_started |= mask
+
+    def start_idle(self):
+        """Start a fresh segment for every mover that has none."""
+        self.start_random(self.needs_movement())
+
+    def redirect_to_center(self, mask, now=None):
+        """Turn the masked movers towards the origin for ``redirect_step`` pixels."""
+        at_center = mask & (np.abs(self.x) < 1) & (np.abs(self.y) < 1)
+        push = mask & ~at_center
+        self.start_random(at_center, now)
+        if np.any(push):
+            self.set_heading(push, np.degrees(np.arctan2(-self.y[push], -self.x[push])) % 360.0)
+            self.remaining[push] = self.redirect_step
+            self.paused_until[push] = self._pause_end(push, now)
+            self.redirecting[push] = True
+            self.segment_started |= push
+
+    def step(self, dt):
+        """Advance every mover by ``dt`` seconds of simulated time."""
+        self.time += dt
+        active = self.paused_until <= self.time
+
+        idle = active & (self.remaining <= 0)
+        moving = active & ~idle
+        self.start_random(idle)
+
+        if not moving.any():
+            return
+
+        # Full-width arithmetic is cheaper than fancy indexing for large N;
+        # inactive movers simply get a zero-length step.
+        step = np.minimum(self.speed * dt, self.remaining)
+        step *= moving
+        self.x += self.ux * step
+        self.y += self.uy * step
+        self.remaining -= step
+
+        out = (np.abs(self.x) > self.max_x) | (np.abs(self.y) > self.max_y)
+        out &= moving
+        if out.any():
+            self.redirect_to_center(out)
+
+    def advance(self, duration):
+        """Jump every mover ``duration`` seconds ahead, event by event.
+
+        Each pass moves every mover straight to its next event: a pause ending,
+        a segment ending, or the exact moment it reaches a wall, which then
+        redirects it towards the center. Cost grows with the number of
+        events, not with ``duration``.
+
+        Pick, pause and redirect rules are step()'s, but walls are not handled
+        the same way. step() moves a whole tick before checking the bounds, so
+        a mover overshoots the wall by up to one step, and if its first step
+        back is still outside it redirects and pauses again. advance() stops
+        the mover exactly on the wall and redirects it once. Random draws also
+        happen in a different order. A time-warped run therefore follows a
+        different path from a 1x run with the same seed, even with one mover.
+        """
+        end = self.time + float(duration)
+        now = np.full(self.count, self.time)
+        while True:
+            live = now < end
+            if not live.any():
+                break
+            before = now.sum()
+
+            # One pass per segment: pick it, sit out its pause, then travel.
+            self.start_random(live & (self.paused_until <= now) & (self.remaining <= 0), now)
+            paused = live & (self.paused_until > now)
+            now[paused] = np.minimum(self.paused_until[paused], end)
+
+            idx = np.flatnonzero((now < end) & (self.paused_until <= now) & (self.remaining > 0))
+            if self.speed <= 0:
+                now[idx] = end
+                idx = idx[:0]
+
+            x, y = self.x[idx], self.y[idx]
+            ux, uy = self.ux[idx], self.uy[idx]
+            # Distance along the heading to the first wall; inf when moving parallel to it.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                to_x = np.where(ux > 0, (self.max_x - x) / ux,
+                                np.where(ux < 0, (-self.max_x - x) / ux, np.inf))
+                to_y = np.where(uy > 0, (self.max_y - y) / uy,
+                                np.where(uy < 0, (-self.max_y - y) / uy, np.inf))
+            wall = np.maximum(np.minimum(to_x, to_y), 0.0)
+            seg = self.remaining[idx]
+            budget = (end - now[idx]) * self.speed
+
+            dist = np.minimum(np.minimum(seg, wall), budget)
+            self.x[idx] = np.clip(x + ux * dist, -self.max_x, self.max_x)
+            self.y[idx] = np.clip(y + uy * dist, -self.max_y, self.max_y)
+            self.remaining[idx] = seg - dist
+            now[idx] += dist / self.speed
+
+            out_of_time = budget <= np.minimum(seg, wall)
+            now[idx[out_of_time]] = end
+            # Reaching a wall before the segment ends is what step() detects as leaving the bounds.
+            hit = np.zeros(self.count, dtype=bool)
+            hit[idx[(wall < seg) & ~out_of_time]] = True
+            self.redirect_to_center(hit, now)
+
+            if now.sum() == before:
+                # Zero-size bounds with no pause: nothing can make progress.
+                break
+        self.time = end
@@ -0,0 +1,255 @@
+"""
+Headless frame / video export.
+Runs the motion engine offline and rasterizes its frames with Pillow across a
+process pool, using the same shapes as the Streamlit sketch. Each chunk of
+frames is simulated just before it is submitted, so memory stays bounded by
+the chunks in flight rather than the clip length. Output is either
+a directory of numbered PNGs or a raw rgb24 stream in frame order, e.g.:
+
+    python export.py --seconds 30 --raw - | ffmpeg -f rawvideo -pix_fmt rgb24 \\
+        -s 1920x1080 -r 60 -i - out.mp4
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from engine import MotionEngine, playfield_bounds
+from scheduler import SIM_STEP
+
+SHAPES = ("circle", "glow", "square", "triangle", "star", "heart", "ring")
+ROTATING_SHAPES = ("square", "triangle", "star")
+SUPERSAMPLE = 4
+CHUNK_FRAMES = 8
+
+
+def simulate(frames, fps, width, height, size, count=1, speed=None, seed=None,
+             chunk_frames=CHUNK_FRAMES):
+    """Run the engine, yielding (start, x, y, heading) per block of up to chunk_frames frames.
+
+    Each array has shape (block frames, count); the next block is only simulated once the
+    caller asks for it.
+    """
+    engine = MotionEngine(count=count, seed=seed)
+    if speed is not None:
+        engine.speed = float(speed)
+    engine.set_bounds(*playfield_bounds(width, height, size))
+    engine.start_random(engine.needs_movement())
+
+    frame_dt = 1.0 / fps
+    substeps = max(1, math.ceil(frame_dt / SIM_STEP))
+    dt = frame_dt / substeps
+    for start in range(0, frames, chunk_frames):
+        n = min(chunk_frames, frames - start)
+        xs = np.empty((n, count), dtype=np.float32)
+        ys = np.empty((n, count), dtype=np.float32)
+        hs = np.empty((n, count), dtype=np.float32)
+        for i in range(n):
+            xs[i] = engine.x
+            ys[i] = engine.y
+            hs[i] = engine.heading
+            for _ in range(substeps):
+                engine.step(dt)
+        yield start, xs, ys, hs
+
+
+def _heart_points(size):
+    pts = []
+    for a in np.arange(0.0, 2 * math.pi, 0.05):
+        hx = 16 * math.sin(a) ** 3
+        hy = -(13 * math.cos(a) - 5 * math.cos(2 * a) - 2 * math.cos(3 * a) - math.cos(4 * a))
+        pts.append((hx * size * 0.03, hy * size * 0.03 - size * 0.15))
+    return pts
+
+
+def _star_points(r1, r2, npoints=5):
+    step = 2 * math.pi / npoints
+    pts = []
+    for i in range(npoints):
+        a = -math.pi / 2 + i * step
+        pts.append((math.cos(a) * r2, math.sin(a) * r2))
+        pts.append((math.cos(a + step / 2) * r1, math.sin(a + step / 2) * r1))
+    return pts
+
+
+def _rounded_square_points(size, radius, segments=6):
+    h = size / 2.0
+    pts = []
+    corners = ((h - radius, -h + radius, -90), (h - radius, h - radius, 0),
+               (-h + radius, h - radius, 90), (-h + radius, -h + radius, 180))
+    for cx, cy, start in corners:
+        for k in range(segments + 1):
+            a = math.radians(start + 90.0 * k / segments)
+            pts.append((cx + math.cos(a) * radius, cy + math.sin(a) * radius))
+    return pts
+
+
+def shape_outline(shape, size):
+    """Unrotated outline of ``shape`` centred on the origin, in screen (y-down) space."""
+    if shape == "square":
+        return _rounded_square_points(size, size * 0.25)
+    if shape == "triangle":
+        return [(0.0, -size / 1.5), (-size / 2.0, size / 2.0), (size / 2.0, size / 2.0)]
+    if shape == "star":
+        return _star_points(size / 2.5, size)
+    if shape == "heart":
+        return _heart_points(size)
+    raise ValueError(shape)
+
+
+def make_sprite(shape, size, color):
+    """Antialiased RGBA sprite for the shapes that never rotate."""
+    pad = size * 2 if shape == "glow" else 2
+    extent = int(math.ceil(size + pad * 2))
+    ss = SUPERSAMPLE
+    img = Image.new("RGBA", (extent * ss, extent * ss), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    c = extent * ss / 2.0
+    r = size * ss / 2.0
+    if shape == "ring":
+        draw.ellipse((c - r, c - r, c + r, c + r), outline=color, width=max(1, int(size * 0.2 * ss)))
+    elif shape == "heart":
+        draw.polygon([(c + px * ss, c + py * ss) for px, py in _heart_points(size)], fill=color)
+    else:
+        draw.ellipse((c - r, c - r, c + r, c + r), fill=color)
+    img = img.resize((extent, extent), Image.LANCZOS)
+    if shape == "glow":
+        halo = img.filter(ImageFilter.GaussianBlur(size * 0.75))
+        halo.alpha_composite(img)
+        img = halo
+    return img
+
+
+class FrameRenderer:
+    def __init__(self, width, height, shape, size, color, bg_color):
+        self.width = width
+        self.height = height
+        self.shape = shape
+        self.size = size
+        self.color = color
+        self.base = Image.new("RGB", (width, height), bg_color)
+        if shape in ROTATING_SHAPES:
+            self.sprite = None
+            self.outline = np.asarray(shape_outline(shape, size))
+        else:
+            self.sprite = make_sprite(shape, size, color)
+            self.outline = None
+
+    def _rotation(self, heading_deg, t):
+        if self.shape == "triangle":
+            # Face the direction of travel; turtle headings are y-up.
+            return -math.radians(heading_deg) + math.pi / 2
+        if self.shape == "square":
+            return t / 1.5
+        return t / 1.0
+
+    def render(self, xs, ys, hs, t):
+        img = self.base.copy()
+        cx0 = self.width / 2.0
+        cy0 = self.height / 2.0
+        if self.sprite is not None:
+            half = self.sprite.width // 2
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                pos = (int(round(cx0 + x)) - half, int(round(cy0 - y)) - half)
+                img.paste(self.sprite, pos, self.sprite)
+            return img
+        draw = ImageDraw.Draw(img)
+        for x, y, h in zip(xs.tolist(), ys.tolist(), hs.tolist()):
+            a = self._rotation(h, t)
+            ca, sa = math.cos(a), math.sin(a)
+            rot = self.outline @ np.array([[ca, sa], [-sa, ca]])
+            rot[:, 0] += cx0 + x
+            rot[:, 1] += cy0 - y
+            draw.polygon([tuple(p) for p in rot.tolist()], fill=self.color)
+        return img
+
+
+_renderer = None
+
+
+def _init_worker(width, height, shape, size, color, bg_color):
+    global _renderer
+    _renderer = FrameRenderer(width, height, shape, size, color, bg_color)
+
+
+def _render_chunk(start, xs, ys, hs, fps, out_dir):
+    """Render one contiguous run of frames; return raw bytes or write PNGs."""
+    chunks = []
+    for i in range(len(xs)):
+        frame = start + i
+        img = _renderer.render(xs[i], ys[i], hs[i], frame / fps)
+        if out_dir is None:
+            chunks.append(img.tobytes())
+        else:
+            img.save(os.path.join(out_dir, f"frame_{frame:06d}.png"), compress_level=1)
+    return b"".join(chunks)
+
+
+def export(frames, fps, width, height, shape, size, color, bg_color, out_dir=None,
+           raw=None, count=1, speed=None, seed=None, workers=None, chunk_frames=CHUNK_FRAMES):
+    blocks = simulate(frames, fps, width, height, size, count=count, speed=speed, seed=seed,
+                      chunk_frames=chunk_frames)
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    window = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(width, height, shape, size, color, bg_color)) as pool:
+        pending = deque()
+        for start, xs, ys, hs in blocks:
+            pending.append(pool.submit(_render_chunk, start, xs, ys, hs, fps, out_dir))
+            # Keep a bounded window in flight and drain in submission order.
+            if len(pending) >= window:
+                data = pending.popleft().result()
+                if raw is not None:
+                    raw.write(data)
+        while pending:
+            data = pending.popleft().result()
+            if raw is not None:
+                raw.write(data)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render the random moving dot offline")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--shape", choices=SHAPES, default="circle")
+    parser.add_argument("--size", type=int, default=24)
+    parser.add_argument("--color", default="#00ffff")
+    parser.add_argument("--bg-color", default="#2b2b2b")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--speed", type=float, help="pixels per second")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--workers", type=int)
+    out = parser.add_mutually_exclusive_group(required=True)
+    out.add_argument("--out", metavar="DIR", help="write numbered PNG frames here")
+    out.add_argument("--raw", metavar="PATH", help="write an rgb24 stream here ('-' for stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    frames = int(round(args.seconds * args.fps))
+    kwargs = dict(count=args.count, speed=args.speed, seed=args.seed, workers=args.workers)
+    render_args = (frames, args.fps, args.width, args.height, args.shape, args.size,
+                   args.color, args.bg_color)
+    if args.out:
+        export(*render_args, out_dir=args.out, **kwargs)
+    elif args.raw == "-":
+        export(*render_args, raw=sys.stdout.buffer, **kwargs)
+    else:
+        with open(args.raw, "wb") as f:
+            export(*render_args, raw=f, **kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Per-frame timing instrumentation.
+Phase durations are written into a preallocated NumPy ring buffer so the
+recorder can stay enabled permanently; percentiles and FPS are computed only
+when somebody asks for them.
+"""
+
+import csv
+import time
+
+import numpy as np
+
+PHASES = ("frame", "simulation", "draw", "screen_update", "lateness")
+DEFAULT_CAPACITY = 600
+
+
+class FrameTimings:
+    def __init__(self, capacity=DEFAULT_CAPACITY, clock=time.perf_counter):
+        self.capacity = int(capacity)
+        self.clock = clock
+        self.columns = {name: i for i, name in enumerate(PHASES)}
+        self.starts = np.zeros(self.capacity)
+        self.data = np.zeros((self.capacity, len(PHASES)))
+        self.total_frames = 0
+        self._row = -1
+        self._frame_start = 0.0
+
+    @property
+    def size(self):
+        return min(self.total_frames, self.capacity)
+
+    def begin_frame(self):
+        """Open a new row; call once at the top of every animation tick."""
+        self._frame_start = self.clock()
+        self._row = self.total_frames % self.capacity
+        self.total_frames += 1
+        self.starts[self._row] = self._frame_start
+        self.data[self._row] = 0.0
+
+    def end_frame(self):
+        if self._row >= 0:
+            self.data[self._row, 0] = self.clock() - self._frame_start
+
+    def record(self, phase, seconds):
+        if self._row >= 0:
+            self.data[self._row, self.columns[phase]] += seconds
+
+    def _ordered(self):
+        n = self.size
+        if n < self.capacity:
+            return self.starts[:n], self.data[:n]
+        head = self.total_frames % self.capacity
+        order = np.r_[head:self.capacity, 0:head]
+        return self.starts[order], self.data[order]
+
+    def percentiles(self, phase, qs=(50, 95, 99)):
+        """Return the requested percentiles of ``phase`` in milliseconds."""
+        n = self.size
+        if n == 0:
+            return tuple(0.0 for _ in qs)
+        values = self.data[:n, self.columns[phase]]
+        return tuple(float(v) * 1000.0 for v in np.percentile(values, qs))
+
+    def fps(self):
+        """Frames per second actually delivered over the buffered window."""
+        n = self.size
+        if n < 2:
+            return 0.0
+        starts = self.starts[:n]
+        span = float(starts.max() - starts.min())
+        return (n - 1) / span if span > 0 else 0.0
+
+    def summary(self):
+        out = {"fps": self.fps()}
+        for phase in PHASES:
+            out[phase] = self.percentiles(phase)
+        return out
+
+    def to_csv(self, path):
+        """Write the buffered frames in chronological order, durations in ms."""
+        starts, data = self._ordered()
+        origin = starts[0] if len(starts) else 0.0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("t_s",) + tuple(f"{p}_ms" for p in PHASES))
+            for t, row in zip(starts.tolist(), data.tolist()):
+                writer.writerow([f"{t - origin:.6f}"] + [f"{v * 1000.0:.4f}" for v in row])
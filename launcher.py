@@ -1,49 +1,214 @@
+import asyncio
+import logging
+import socket
+import threading
 import subprocess
 import time
+import urllib.request
 import webview
 import sys
 import os
 
-PORT = "8501"
+LAUNCH_STARTED = time.perf_counter()
+
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8501
+READY_TIMEOUT_S = 30.0
+POLL_INITIAL_S = 0.02
+POLL_MAX_S = 0.5
+POLL_BACKOFF = 1.5
+SHUTDOWN_TIMEOUT_S = 5.0
 
 if getattr(sys, 'frozen', False):
     base_dir = sys._MEIPASS
+    log_dir = os.path.dirname(sys.executable)
 else:
     base_dir = os.path.dirname(os.path.abspath(__file__))
+    log_dir = base_dir
 
 app_path = os.path.join(base_dir, "streamlit_app.py")
+log_path = os.path.join(log_dir, "startup.log")
+
+log = logging.getLogger("launcher")
+
+
+def find_free_port(preferred=DEFAULT_PORT):
+    """Return ``preferred`` if it is free, otherwise any free port from the OS."""
+    for port in (preferred, 0):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if os.name != "nt":
+                # Match the server's own bind so a port in TIME_WAIT still counts as free.
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind((HOST, port))
+            except OSError:
+                continue
+            return s.getsockname()[1]
+    raise RuntimeError("No free TCP port available")
+
+
+def wait_for_server(port, process=None, timeout=READY_TIMEOUT_S):
+    """Poll Streamlit's health endpoint with backoff until it answers.
+
+    Raises RuntimeError if the server process exits or the timeout passes.
+    """
+    url = f"http://{HOST}:{port}/_stcore/health"
+    deadline = time.perf_counter() + timeout
+    delay = POLL_INITIAL_S
+    while True:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Streamlit server exited with code {process.returncode} before becoming ready")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            pass
+        if time.perf_counter() + delay > deadline:
+            raise RuntimeError(f"Streamlit server did not become ready on port {port} within {timeout:.0f} s")
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_S)
+
+
+def server_flag_options(port):
+    return {
+        "global_developmentMode": False,
+        "server_headless": True,
+        "browser_gatherUsageStats": False,
+        "server_address": HOST,
+        "server_port": port,
+    }
 
-if len(sys.argv) > 1 and sys.argv[1] == "RUN_STREAMLIT":
+
+def run_streamlit(port):
     import streamlit.web.cli as stcli
-    sys.argv = [
-        "streamlit", "run", app_path, 
-        "--global.developmentMode", "false",
-        "--server.headless", "true", 
-        "--browser.gatherUsageStats", "false", 
-        "--server.port", PORT
-    ]
+    sys.argv = ["streamlit", "run", app_path]
+    for name, value in server_flag_options(port).items():
+        sys.argv += ["--" + name.replace("_", "."), str(value).lower() if isinstance(value, bool) else str(value)]
     sys.exit(stcli.main())
 
+
+class InProcessServer:
+    """Runs the Streamlit server on a background thread of this process.
+
+    Saves the second interpreter (and, in the onefile build, the second
+    archive extraction) that the subprocess mode pays for.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self.server = None
+        self.loop = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="streamlit-server", daemon=True)
+
+    def poll(self):
+        # Mirrors subprocess.Popen.poll() so wait_for_server can watch either mode.
+        return None if self._thread.is_alive() else 1
+
+    @property
+    def returncode(self):
+        return self.poll()
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        try:
+            from streamlit.web import bootstrap
+            from streamlit.web.server import Server
+
+            bootstrap.load_config_options(server_flag_options(self.port))
+            sys.path.insert(0, os.path.dirname(app_path))
+
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.server = Server(app_path, False)
+
+            async def serve():
+                await self.server.start()
+                await self.server.stopped
+
+            self.loop.run_until_complete(serve())
+        except Exception as exc:
+            self.error = exc
+            log.exception("in-process Streamlit server failed")
+
+    def stop(self, timeout=SHUTDOWN_TIMEOUT_S):
+        if self.loop is not None and self.server is not None and self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self.server.stop)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            log.warning("Streamlit server thread did not stop within %.0f s", timeout)
+
+
+def rss_mb(pid=None):
+    """Resident set size of ``pid`` in MiB from /proc, or None where unavailable."""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return None
+
+
+if len(sys.argv) > 2 and sys.argv[1] == "RUN_STREAMLIT":
+    run_streamlit(int(sys.argv[2]))
+
 class Api:
     def exit_app(self):
         print("Exit command received from UI. Shutting down...")
         window.destroy()
 
-if __name__ == "__main__":
-    if getattr(sys, 'frozen', False):
-        cmd = [sys.executable, "RUN_STREAMLIT"]
+def _on_shown():
+    rss = [rss_mb()]
+    if isinstance(server, subprocess.Popen):
+        rss.append(rss_mb(server.pid))
+    total = sum(r for r in rss if r is not None) if all(r is not None for r in rss) else None
+    log.info("window shown after %.3f s (%s mode, RSS %s)",
+             time.perf_counter() - LAUNCH_STARTED, mode,
+             f"{total:.0f} MiB" if total is not None else "n/a")
+
+def stop_server():
+    if isinstance(server, InProcessServer):
+        server.stop()
     else:
-        cmd = [sys.executable, __file__, "RUN_STREAMLIT"]
+        server.terminate()
+        server.wait()
 
-    server_process = subprocess.Popen(cmd)
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s",
+        handlers=[logging.StreamHandler(), logging.FileHandler(log_path, encoding="utf-8")],
+    )
+
+    port = find_free_port()
+    mode = "single-process" if "--single-process" in sys.argv[1:] else "subprocess"
+    if mode == "single-process":
+        server = InProcessServer(port)
+        server.start()
+    else:
+        if getattr(sys, 'frozen', False):
+            cmd = [sys.executable, "RUN_STREAMLIT", str(port)]
+        else:
+            cmd = [sys.executable, __file__, "RUN_STREAMLIT", str(port)]
+        server = subprocess.Popen(cmd)
 
-    time.sleep(2)
+    try:
+        wait_for_server(port, server)
+    except RuntimeError as exc:
+        log.error("startup failed: %s", exc)
+        stop_server()
+        sys.exit(1)
+    log.info("server ready on port %d after %.3f s", port, time.perf_counter() - LAUNCH_STARTED)
 
     api = Api()
-    window = webview.create_window("Random Dot App", f"http://localhost:{PORT}", fullscreen=True, js_api=api)
+    window = webview.create_window("Random Dot App", f"http://{HOST}:{port}", fullscreen=True, js_api=api)
+    window.events.shown += _on_shown
     webview.start()
-    
-    if server_process:
-        server_process.terminate()
-        server_process.wait()
-    os._exit(0)
\ No newline at end of file
+
+    stop_server()
+    os._exit(0)
@@ -0,0 +1,92 @@
+"""
+Small localhost HTTP endpoint that runs next to the Streamlit server.
+The sketch lives in a sandboxed iframe that Streamlit only writes to, so any
+browser-to-Python traffic (telemetry, trajectory refills) goes through here.
+Routes are plain functions taking the query dict and request body and
+returning (status, content type, body bytes).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    routes = None
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        route, allow_origin = self.routes.get((method, url.path), (None, None))
+        if route is None:
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.send_error(413)
+            return
+        body = self.rfile.read(length) if length else b""
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            status, content_type, payload = route(query, body)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            self.send_error(400)
+            return
+        self.send_response(status)
+        origin = self.headers.get("Origin")
+        if isinstance(allow_origin, str):
+            self.send_header("Access-Control-Allow-Origin", allow_origin)
+        elif allow_origin is not None and origin in allow_origin:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Vary", "Origin")
+        self.send_header("Cache-Control", "no-store")
+        if payload:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalApiServer:
+    def __init__(self, host="127.0.0.1", port=0):
+        self.routes = {}
+        handler = type("LocalApiHandler", (_Handler,), {"routes": self.routes})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, method, path, fn, allow_origin="*"):
+        """Register ``fn`` for ``method path`` and say who may read its replies.
+
+        ``allow_origin`` is either a string sent as Access-Control-Allow-Origin
+        (``*`` for replies that are harmless to anyone), a collection of origins
+        whose requests get their own Origin echoed back, or None for routes that
+        nobody should read cross-origin. The collection is consulted on every
+        request, so origins can be added while the server runs.
+        """
+        self.routes[(method, path)] = (fn, allow_origin)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="local-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -1,23 +1,50 @@
+import argparse
+import time
 import tkinter as tk
 import customtkinter as ctk
 import turtle
-import random
-import time
+
+from canvas_renderer import BASE_RADIUS, CanvasSwarmRenderer
+from engine import MotionEngine, playfield_bounds
+from frame_stats import PHASES, FrameTimings
+from occupancy import OccupancyGrid
+from scheduler import SIM_STEP, FixedStepScheduler
+from settings import PendingSettings
+from shared_swarm import SharedSwarm
+from sim_thread import SimulationThread, Snapshot
+from spatial import Collider
+from trajectory import TrajectoryPlayer, TrajectoryRecorder
 
 BG_COLOR = "#2b2b2b" 
+BG_COLOR_RGB = (0x2b, 0x2b, 0x2b)
 DOT_COLOR = "#1f6aa5"
-STEP_SIZE = 3.0
+SPEED = 180.0  # pixels per second
 FRAME_DELAY_MS = 16
 PAUSE_ON_TURN = 0.35
 MIN_DISTANCE = 100
 MAX_DISTANCE = 600
-EDGE_MARGIN = 15
 REDIRECT_STEP = 150
+MAX_OBJECTS = 5000
+TIME_WARPS = {"1x": 1, "10x": 10, "100x": 100, "1000x": 1000}
+COLLISIONS = {"Off": "off", "Bounce": "bounce", "Avoid": "avoid"}
+STATS_REFRESH_MS = 500
 
 class RandomDotApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, timings_csv=None, seed=None, record_path=None, replay_path=None,
+                 coverage_path=None, threaded=False, processes=None, movers=1, coalesce=True):
         super().__init__()
 
+        self.timings_csv = timings_csv
+        self.coverage_path = coverage_path
+        self.record_path = record_path
+        self.recorder = None
+        self.player = TrajectoryPlayer(replay_path) if replay_path else None
+        self.replay_time = 0.0
+        self.timings = FrameTimings()
+        self.redraws = 0
+        self.read_misses = 0
+        self._redraw_id = None
+
         ctk.set_appearance_mode("Dark") 
         ctk.set_default_color_theme("blue") 
 
@@ -45,26 +72,98 @@ class RandomDotApp(ctk.CTk):
 
         self.dot = turtle.RawTurtle(self.screen)
         self._configure_dot()
+        self.swarm = CanvasSwarmRenderer(self.canvas_widget, DOT_COLOR)
 
         self.max_x = 0
+        self.dot_scale = 1.0
         self.max_y = 0
         self._update_bounds()
+        self.occupancy = OccupancyGrid(self.max_x, self.max_y)
+        self.coverage_item = None
+        self.coverage_image = None
 
         self.anim_state = {
-            "target_angle": None,
-            "remaining_distance": 0.0,
-            "paused_until": 0.0,
-            "is_redirecting": False,
             "running": False,
-            "step_size": STEP_SIZE,
-            "frame_delay_ms": FRAME_DELAY_MS
+            "speed": SPEED,
+            "frame_delay_ms": FRAME_DELAY_MS,
+            "time_warp": 1
         }
+        # With processes the population is sharded over worker processes and
+        # read back zero-copy from shared memory; its size is fixed at startup.
+        engine_cls = SharedSwarm if processes else MotionEngine
+        extra = {"workers": processes} if processes else {}
+        self.engine = engine_cls(
+            movers if processes else 1,
+            speed=SPEED,
+            pause=PAUSE_ON_TURN,
+            min_distance=MIN_DISTANCE,
+            max_distance=MAX_DISTANCE,
+            redirect_step=REDIRECT_STEP,
+            seed=seed,
+            **extra,
+        )
+        self.engine.set_bounds(self.max_x, self.max_y)
+        self.collider = Collider(BASE_RADIUS * 2, mode="off")
+        if threaded:
+            # The worker owns the engine; Tk only draws the latest published snapshot.
+            self.sim = SimulationThread(self.engine, self._simulate, step=SIM_STEP)
+            self.view = Snapshot(self.engine.count)
+            self.view.load(self.engine)
+            # Reads land here and only replace the view once they are known to be whole.
+            self._incoming = Snapshot(self.engine.count)
+            update, step = self._no_update, FRAME_DELAY_MS / 1000.0
+        else:
+            self.sim = None
+            self.view = self.engine
+            update, step = self._simulate, SIM_STEP
+        self.scheduler = FixedStepScheduler(
+            self,
+            update,
+            self.frame_step,
+            step=step,
+            frame_interval=FRAME_DELAY_MS / 1000.0,
+            timings=self.timings,
+        )
+        # Control and resize callbacks only record values; the batch is applied
+        # once per frame (or once per FRAME_DELAY_MS while stopped).
+        self.settings = PendingSettings(
+            self,
+            self._apply_settings,
+            lambda: self.anim_state["running"],
+            self._redraw,
+            delay_ms=FRAME_DELAY_MS,
+            immediate=not coalesce,
+        )
         self._build_controls()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(STATS_REFRESH_MS, self._update_stats_label)
 
         self.canvas_widget.bind("<Configure>", self._on_canvas_configure)
 
-        a, d = self._pick_new_direction_and_distance()
-        self._start_new_movement(a, d)
+        if self.record_path:
+            # A warped tick runs many segments but a recording samples once per tick,
+            # so replaying it would not match the run.
+            self.warp_option.configure(state="disabled")
+
+        if self.player is not None:
+            self.set_object_count(self.player.count)
+            self.count_slider.set(self.player.count)
+            self.count_slider.configure(state="disabled")
+        elif processes:
+            # Only the first MAX_OBJECTS movers get canvas items.
+            drawn = min(self.engine.count, MAX_OBJECTS)
+            if drawn > 1:
+                self.dot.hideturtle()
+                self.swarm.set_count(drawn)
+            self.count_label.configure(text=f"Objects: {self.engine.count} ({processes} processes)")
+            self.count_slider.set(drawn)
+            self.count_slider.configure(state="disabled")
+            # Collisions need every mover in one process.
+            self.collision_option.configure(state="disabled")
+        else:
+            self.engine.start_idle()
+        if self.sim is not None:
+            self.sim.start()
 
     def _configure_dot(self):
         self.dot.hideturtle()
@@ -78,68 +177,151 @@ class RandomDotApp(ctk.CTk):
     def _update_bounds(self):
         width = max(self.canvas_widget.winfo_width(), 1)
         height = max(self.canvas_widget.winfo_height(), 1)
-        self.max_x = width / 2.0 - EDGE_MARGIN
-        self.max_y = height / 2.0 - EDGE_MARGIN
+        self.max_x, self.max_y = playfield_bounds(width, height, BASE_RADIUS * 2 * self.dot_scale)
 
     def _on_canvas_configure(self, event):
-        self._update_bounds()
-        x, y = self.dot.position()
-        new_x = min(max(x, -self.max_x), self.max_x)
-        new_y = min(max(y, -self.max_y), self.max_y)
-        if new_x != x or new_y != y:
-            self.dot.setposition(new_x, new_y)
-        self.screen.update()
-
-    def _pick_new_direction_and_distance(self):
-        angle = random.uniform(0, 360)
-        distance = random.uniform(MIN_DISTANCE, MAX_DISTANCE)
-        return angle, distance
-
-    def _start_new_movement(self, angle_deg, distance, redirecting=False):
-        self.anim_state["target_angle"] = angle_deg % 360
-        self.anim_state["remaining_distance"] = float(distance)
-        self.anim_state["paused_until"] = time.time() + PAUSE_ON_TURN
-        self.anim_state["is_redirecting"] = bool(redirecting)
-
-    def _schedule_redirect_to_center(self, push_distance=REDIRECT_STEP):
-        x, y = self.dot.position()
-        angle_to_center = self.dot.towards(0, 0)
-        if abs(x) < 1 and abs(y) < 1:
-            a, d = self._pick_new_direction_and_distance()
-            self._start_new_movement(a, d, redirecting=False)
-        else:
-            self._start_new_movement(angle_to_center, push_distance, redirecting=True)
+        # Bounds are read from the canvas when the batch is applied, so only the latest size counts.
+        self.settings.set("bounds")
 
-    def frame_step(self):
-        now = time.time()
-
-        if not self.anim_state["running"]:
-            self.screen.update()
+    def _control(self, fn, *args):
+        """Apply an engine change directly, or hand it to the simulation thread."""
+        if self.sim is None:
+            fn(*args)
             return
+        self.sim.submit(fn, *args)
+        if not self.anim_state["running"]:
+            # No frame loop to pick up the result; redraw once the worker has applied it.
+            self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        if self._redraw_id is None:
+            self._redraw_id = self.after(FRAME_DELAY_MS, self._redraw_latest)
+
+    def _redraw_latest(self):
+        self._redraw_id = None
+        self._read_latest()
+        self._draw_dot()
+        self._refresh()
+
+    def _read_latest(self):
+        """Take the newest published snapshot, or keep the last good one if every read raced the writer."""
+        if self.sim.read(self._incoming):
+            self.view, self._incoming = self._incoming, self.view
+        else:
+            self.read_misses += 1
 
-        if now < self.anim_state["paused_until"]:
-            self.screen.update()
-            self.screen.ontimer(self.frame_step, self.anim_state["frame_delay_ms"])
+    def _redraw(self):
+        if self.sim is not None:
+            self._schedule_redraw()
             return
+        self._draw_dot()
+        self._refresh()
 
-        if self.anim_state["target_angle"] is None or self.anim_state["remaining_distance"] <= 0:
-            a, d = self._pick_new_direction_and_distance()
-            self._start_new_movement(a, d)
-            self.screen.update()
-            self.screen.ontimer(self.frame_step, self.anim_state["frame_delay_ms"])
-            return
+    def _no_update(self, dt):
+        pass
 
-        step = min(self.anim_state["step_size"], self.anim_state["remaining_distance"])
-        self.dot.setheading(self.anim_state["target_angle"])
-        self.dot.forward(step)
-        self.anim_state["remaining_distance"] -= step
+    def _is_swarm(self):
+        return self.swarm.count > 0
 
-        x, y = self.dot.position()
-        if abs(x) > self.max_x or abs(y) > self.max_y:
-            self._schedule_redirect_to_center(push_distance=REDIRECT_STEP)
+    def _draw_dot(self):
+        view = self.view
+        if self._is_swarm():
+            self.swarm.draw(view.x[:view.count], view.y[:view.count])
+            return
+        self.dot.setheading(float(view.heading[0]))
+        self.dot.setposition(float(view.x[0]), float(view.y[0]))
+
+    def _refresh(self):
+        self.redraws += 1
+        # Swarm items are plain canvas items and redraw on the next idle pass;
+        # only the turtle needs an explicit screen update.
+        if not self._is_swarm():
+            self.screen.update()
+
+    def set_object_count(self, count):
+        self._apply_count(count)
+        self._redraw()
+
+    def _apply_count(self, count):
+        count = min(max(int(count), 1), MAX_OBJECTS)
+        self.count_label.configure(text=f"Objects: {count}")
+        self._control(self._resize_movers, count)
+        if count > 1:
+            self.dot.hideturtle()
+            self.swarm.set_count(count)
+        else:
+            self.swarm.clear()
+            self.dot.showturtle()
+
+    def _resize_movers(self, count):
+        old = self.engine.count
+        self.engine.resize(count)
+        if self.collider.mode != "off" and count > old:
+            # New movers spawn at the center; keep them from starting inside each other.
+            self.collider.spread(self.engine, slice(old, count))
+
+    def _apply_settings(self, changes):
+        """Apply one batch of control changes, each at its latest value."""
+        if "speed" in changes:
+            self.anim_state["speed"] = changes["speed"]
+            self._control(setattr, self.engine, "speed", changes["speed"])
+        if "warp" in changes and not self.record_path:
+            self.anim_state["time_warp"] = changes["warp"]
+        if "pause" in changes:
+            self._control(self._set_pause, changes["pause"])
+        if "count" in changes:
+            self._apply_count(changes["count"])
+        if "size" in changes:
+            v = self.dot_scale = changes["size"]
+            self.dot.shapesize(v, v, 1)
+            self.swarm.set_size(v)
+            # Contact distance, and with it the collision grid's cell size, follows the dot size.
+            self._control(self.collider.set_diameter, BASE_RADIUS * 2 * v)
+        if "bounds" in changes or "size" in changes:
+            # Bigger dots keep the same clearance from the edges.
+            self._update_bounds()
+            self._control(self.engine.set_bounds, self.max_x, self.max_y)
+            self.occupancy.resize(self.max_x, self.max_y)
+        if "collision" in changes:
+            self._control(setattr, self.collider, "mode", changes["collision"])
+        if "color" in changes:
+            self.dot.color(changes["color"])
+            self.swarm.set_color(changes["color"])
+
+    def _simulate(self, dt):
+        warp = self.anim_state["time_warp"]
+        if self.player is not None:
+            # Replay: positions come straight from the recording, no RNG or physics.
+            self.replay_time += dt * warp
+            self.player.positions_at(self.replay_time, self.engine.x, self.engine.y)
+            return
+        if warp == 1:
+            self.engine.step(dt)
+        else:
+            # Jumping event to event keeps a warped tick about as cheap as a normal one.
+            self.engine.advance(dt * warp)
+        if self.collider.mode != "off" and not isinstance(self.engine, SharedSwarm):
+            self.collider.apply(self.engine)
+        if self.recorder is not None:
+            self.recorder.capture(self.engine)
 
-        self.screen.update()
-        self.screen.ontimer(self.frame_step, self.anim_state["frame_delay_ms"])
+    def frame_step(self):
+        # Simulation runs in fixed steps inside the scheduler (or on the
+        # simulation thread); this only renders.
+        self.settings.flush()
+        if self.sim is not None:
+            t = time.perf_counter()
+            self._read_latest()
+            self.timings.record("simulation", time.perf_counter() - t)
+        t0 = time.perf_counter()
+        n = min(self.view.count, MAX_OBJECTS)
+        self.occupancy.add(self.view.x[:n], self.view.y[:n])
+        self._draw_dot()
+        t1 = time.perf_counter()
+        self._refresh()
+        t2 = time.perf_counter()
+        self.timings.record("draw", t1 - t0)
+        self.timings.record("screen_update", t2 - t1)
 
     def _build_controls(self):
         title_lbl = ctk.CTkLabel(self.right_frame, text="Controls", font=("Roboto", 20, "bold"))
@@ -159,11 +341,17 @@ class RandomDotApp(ctk.CTk):
         ctk.CTkLabel(self.right_frame, text="Settings", font=("Roboto", 16)).pack(pady=(20, 10), padx=20, anchor="w")
 
         # Speed Slider
-        ctk.CTkLabel(self.right_frame, text="Speed").pack(padx=20, anchor="w")
-        self.speed_slider = ctk.CTkSlider(self.right_frame, from_=0.5, to=20.0, command=self._on_speed_change)
-        self.speed_slider.set(self.anim_state["step_size"])
+        ctk.CTkLabel(self.right_frame, text="Speed (px/s)").pack(padx=20, anchor="w")
+        self.speed_slider = ctk.CTkSlider(self.right_frame, from_=30.0, to=1200.0, command=self._on_speed_change)
+        self.speed_slider.set(self.anim_state["speed"])
         self.speed_slider.pack(pady=(0, 15), padx=20, fill="x")
 
+        # Time Warp (simulated seconds per real second)
+        ctk.CTkLabel(self.right_frame, text="Time Warp").pack(padx=20, anchor="w")
+        self.warp_option = ctk.CTkOptionMenu(self.right_frame, values=list(TIME_WARPS),
+                                             command=self._on_warp_change)
+        self.warp_option.pack(pady=(0, 15), padx=20, fill="x")
+
         # Dot Size Slider
         ctk.CTkLabel(self.right_frame, text="Dot Size").pack(padx=20, anchor="w")
         self.size_slider = ctk.CTkSlider(self.right_frame, from_=0.5, to=6.0, command=self._on_size_change)
@@ -176,50 +364,167 @@ class RandomDotApp(ctk.CTk):
         self.pause_slider.set(int(PAUSE_ON_TURN * 1000))
         self.pause_slider.pack(pady=(0, 15), padx=20, fill="x")
 
+        # Object Count Slider (more than one switches to swarm mode)
+        self.count_label = ctk.CTkLabel(self.right_frame, text="Objects: 1")
+        self.count_label.pack(padx=20, anchor="w")
+        self.count_slider = ctk.CTkSlider(self.right_frame, from_=1, to=MAX_OBJECTS,
+                                          number_of_steps=MAX_OBJECTS - 1, command=self._on_count_change)
+        self.count_slider.set(1)
+        self.count_slider.pack(pady=(0, 15), padx=20, fill="x")
+
         # Color Option
         ctk.CTkLabel(self.right_frame, text="Color Theme").pack(padx=20, anchor="w")
         self.color_option = ctk.CTkOptionMenu(self.right_frame, values=["Cyan", "Red", "Green", "Yellow", "White"],
                                               command=self._on_color_preset)
         self.color_option.pack(pady=(0, 20), padx=20, fill="x")
 
+        # Mover-to-mover collisions (swarm mode)
+        ctk.CTkLabel(self.right_frame, text="Collisions").pack(padx=20, anchor="w")
+        self.collision_option = ctk.CTkOptionMenu(self.right_frame, values=list(COLLISIONS),
+                                                  command=self._on_collision_change)
+        self.collision_option.pack(pady=(0, 15), padx=20, fill="x")
+
+        # Occupancy heatmap drawn underneath the movers
+        self.coverage_var = tk.BooleanVar(value=False)
+        self.coverage_check = ctk.CTkCheckBox(self.right_frame, text="Show Coverage", variable=self.coverage_var,
+                                              command=self._update_coverage_overlay)
+        self.coverage_check.pack(pady=(0, 15), padx=20, anchor="w")
+
+        # Live frame timing readout
+        ctk.CTkLabel(self.right_frame, text="Performance", font=("Roboto", 16)).pack(pady=(10, 5), padx=20, anchor="w")
+        self.stats_label = ctk.CTkLabel(self.right_frame, text="", justify="left", font=("Roboto Mono", 12))
+        self.stats_label.pack(padx=20, anchor="w")
+
+    def _update_stats_label(self):
+        s = self.timings.summary()
+        c = self.occupancy.summary()
+        lines = [f"FPS: {s['fps']:.1f}", f"Coverage: {c['covered']:.1%} (cv {c['cv']:.2f})"]
+        if self.sim is not None:
+            lines.append(f"Sim thread: {self.sim.steps_per_second:.0f} steps/s, "
+                         f"{self.sim.step_cost * 1000.0:.2f} ms/step, {self.read_misses} missed reads")
+        lines.append("phase      p50 / p95 / p99 ms")
+        for phase in PHASES:
+            p50, p95, p99 = s[phase]
+            lines.append(f"{phase[:10]:<10} {p50:.2f} / {p95:.2f} / {p99:.2f}")
+        self.stats_label.configure(text="\n".join(lines))
+        self._update_coverage_overlay()
+        self.after(STATS_REFRESH_MS, self._update_stats_label)
+
+    def _update_coverage_overlay(self):
+        if not self.coverage_var.get():
+            if self.coverage_item is not None:
+                self.canvas_widget.delete(self.coverage_item)
+                self.coverage_item = None
+                self.coverage_image = None
+            return
+        zoom = max(1, int(self.occupancy.cell))
+        # Tk reads PPM natively; keep a reference or the image is garbage collected.
+        self.coverage_image = tk.PhotoImage(data=self.occupancy.to_ppm(background=BG_COLOR_RGB)).zoom(zoom)
+        if self.coverage_item is None:
+            self.coverage_item = self.canvas_widget.create_image(0, 0, anchor="nw")
+        self.canvas_widget.itemconfigure(self.coverage_item, image=self.coverage_image)
+        self.canvas_widget.coords(self.coverage_item, -self.occupancy.max_x, -self.occupancy.max_y)
+        self.canvas_widget.tag_lower(self.coverage_item)
+
+    def _on_close(self):
+        self.stop()
+        if self.sim is not None:
+            self.sim.stop()
+        if isinstance(self.engine, SharedSwarm):
+            self.engine.close()
+        if self.timings_csv:
+            self.timings.to_csv(self.timings_csv)
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.coverage_path:
+            self.occupancy.save(self.coverage_path)
+        self.destroy()
+
     def start(self):
         if not self.anim_state["running"]:
             self.anim_state["running"] = True
-            if self.anim_state["target_angle"] is None or self.anim_state["remaining_distance"] <= 0:
-                a, d = self._pick_new_direction_and_distance()
-                self._start_new_movement(a, d)
-            self.screen.ontimer(self.frame_step, self.anim_state["frame_delay_ms"])
+            if self.player is None:
+                self._control(self._begin_motion)
+            if self.sim is not None:
+                self.sim.set_running(True)
+            self.scheduler.start()
+
+    def _begin_motion(self):
+        self.engine.start_idle()
+        if self.record_path and self.recorder is None:
+            # The recording covers the movers present when it starts.
+            self.recorder = TrajectoryRecorder(self.record_path, self.engine.count, seed=self.engine.seed)
 
     def stop(self):
         self.anim_state["running"] = False
+        if self.sim is not None:
+            self.sim.set_running(False)
+        self.scheduler.stop()
+        # Changes that arrived after the last frame would otherwise wait for the next one.
+        if self.settings.flush():
+            self._redraw()
 
     def reset_to_center(self):
-        self.dot.setposition(0, 0)
-        self.anim_state["target_angle"] = None
-        self.anim_state["remaining_distance"] = 0.0
-        self.anim_state["paused_until"] = 0.0
-        self.anim_state["is_redirecting"] = False
-        self.screen.update()
+        self._control(self._reset_motion)
+        self._redraw()
+
+    def _reset_motion(self):
+        self.replay_time = 0.0
+        self.engine.reset()
+        if self.collider.mode != "off":
+            self.collider.spread(self.engine)
 
     def _on_speed_change(self, val):
-        self.anim_state["step_size"] = float(val)
+        self.settings.set("speed", float(val))
+
+    def _on_warp_change(self, choice):
+        self.settings.set("warp", TIME_WARPS.get(choice, 1))
+
+    def _on_count_change(self, val):
+        self.settings.set("count", int(round(float(val))))
 
     def _on_size_change(self, val):
-        v = float(val)
-        self.dot.shapesize(v, v, 1)
-        self.screen.update()
+        self.settings.set("size", float(val))
+
+    def _on_collision_change(self, choice):
+        self.settings.set("collision", COLLISIONS.get(choice, "off"))
 
     def _on_pause_change(self, val):
-        global PAUSE_ON_TURN
-        PAUSE_ON_TURN = float(val) / 1000.0
-        self.anim_state["paused_until"] = time.time()
+        self.settings.set("pause", float(val) / 1000.0)
+
+    def _set_pause(self, pause):
+        self.engine.pause = pause
+        self.engine.end_pauses()
 
     def _on_color_preset(self, choice):
         # Map simple presets to hex for the turtle
         colors = {"Cyan": "cyan", "Red": "#ff5555", "Green": "#50fa7b", "Yellow": "#f1fa8c", "White": "white"}
-        self.dot.color(colors.get(choice, "cyan"))
-        self.screen.update()
+        self.settings.set("color", colors.get(choice, "cyan"))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Random moving dot (CustomTkinter)")
+    parser.add_argument("--timings-csv", metavar="PATH",
+                        help="write per-frame timings to this CSV file on exit")
+    parser.add_argument("--seed", type=int, help="seed the motion RNG for a reproducible run")
+    parser.add_argument("--record", metavar="PATH", help="stream the trajectory to this file")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded trajectory")
+    parser.add_argument("--coverage", metavar="PATH",
+                        help="save the occupancy heatmap on exit (.npz to merge later, .npy or an image)")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run the simulation on its own thread, decoupled from drawing")
+    parser.add_argument("--processes", type=int, metavar="N",
+                        help="shard the movers across N worker processes over shared memory")
+    parser.add_argument("--movers", type=int, default=100000,
+                        help=f"mover count with --processes (the first {MAX_OBJECTS} are drawn)")
+    args = parser.parse_args(argv)
+    if args.processes and (args.record or args.replay):
+        parser.error("--processes cannot be combined with --record or --replay")
+    return args
 
 if __name__ == "__main__":
-    app = RandomDotApp()
+    args = parse_args()
+    app = RandomDotApp(timings_csv=args.timings_csv, seed=args.seed,
+                       record_path=args.record, replay_path=args.replay,
+                       coverage_path=args.coverage, threaded=args.threaded,
+                       processes=args.processes, movers=args.movers)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Measures cold start time to the first rendered frame of the Streamlit app.
+Starts the server, opens a pywebview window and waits for the sketch's first
+draw() call. Run it with networking disabled to confirm the app needs nothing
+from the network.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import webview
+
+from launcher import HOST, find_free_port, wait_for_server
+
+TIMEOUT_S = 60.0
+POLL_S = 0.05
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+app_path = os.path.join(base_dir, "streamlit_app.py")
+p5_path = os.path.join(base_dir, "static", "p5.min.js")
+
+
+def watch(window, server, port, started, result):
+    deadline = started + TIMEOUT_S
+    try:
+        wait_for_server(port, server, timeout=TIMEOUT_S)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        window.destroy()
+        return
+    result["server_ready_s"] = time.time() - started
+    window.load_url(f"http://{HOST}:{port}")
+    while time.time() < deadline:
+        first = window.evaluate_js("window.__rdFirstFrame || null")
+        if first:
+            result["first_frame_s"] = first / 1000.0 - started
+            break
+        time.sleep(POLL_S)
+    window.destroy()
+
+
+def main():
+    if not os.path.exists(p5_path):
+        sys.exit(f"{p5_path} is missing; run python vendor_p5.py first")
+    started = time.time()
+    port = find_free_port()
+    server = subprocess.Popen([
+        sys.executable, "-m", "streamlit", "run", app_path,
+        "--server.headless", "true",
+        "--browser.gatherUsageStats", "false",
+        "--server.address", HOST,
+        "--server.port", str(port),
+    ])
+    result = {}
+    try:
+        window = webview.create_window("Cold start measurement", html="<body></body>")
+        webview.start(watch, (window, server, port, started, result))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"server ready:   {result.get('server_ready_s', float('nan')):.2f} s")
+    print(f"first frame:    {result.get('first_frame_s', float('nan')):.2f} s")
+    if "first_frame_s" not in result:
+        sys.exit("No frame rendered before timeout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Measures redraws per second while a control is dragged in the desktop app.
+Synthetic slider (or window resize) events are fired far faster than the
+frame rate, once with every change applied and redrawn on the spot and once
+with changes coalesced into the next frame, both with the animation stopped
+and running. Needs a display.
+
+    python measure_drag.py --control size --objects 1000
+
+--headless runs the same drag without Tk: the slider events, the frame loop
+and PendingSettings are driven by a small after()/after_cancel() loop, and
+each redraw is the swarm renderer's real per-frame work against the
+benchmark's stub canvas.
+"""
+
+import argparse
+import heapq
+import time
+
+from settings import FLUSH_DELAY_MS, PendingSettings
+
+SIZES = (0.5, 6.0)
+WINDOW_SIZES = ((800, 600), (1200, 800))
+
+
+def measure(coalesce, running, control="size", seconds=2.0, interval_ms=1, objects=1):
+    """Drag one control back and forth; returns (events/s, redraws/s)."""
+    from main import RandomDotApp
+
+    app = RandomDotApp(coalesce=coalesce)
+    app.update()
+    if objects > 1:
+        app.set_object_count(objects)
+    app.update()
+    if running:
+        app.start()
+    result = {}
+    start_redraws = app.redraws
+    start_events = app.settings.received
+    t0 = time.perf_counter()
+
+    def fire():
+        elapsed = time.perf_counter() - t0
+        # Triangle wave over the slider's (or window's) range, one sweep per second.
+        phase = abs((elapsed % 1.0) * 2.0 - 1.0)
+        if control == "window":
+            (w0, h0), (w1, h1) = WINDOW_SIZES
+            app.geometry(f"{int(w0 + (w1 - w0) * phase)}x{int(h0 + (h1 - h0) * phase)}")
+        else:
+            v = SIZES[0] + (SIZES[1] - SIZES[0]) * phase
+            app.size_slider.set(v)
+            app._on_size_change(v)
+        if elapsed < seconds:
+            app.after(interval_ms, fire)
+        else:
+            # Let the last batch land before counting.
+            app.after(FLUSH_DELAY_MS * 2, finish)
+
+    def finish():
+        spent = time.perf_counter() - t0
+        result["events"] = (app.settings.received - start_events) / spent
+        result["redraws"] = (app.redraws - start_redraws) / spent
+        app._on_close()
+
+    app.after(0, fire)
+    app.mainloop()
+    return result["events"], result["redraws"]
+
+
+class EventLoop:
+    """Just after() and after_cancel(), run against perf_counter."""
+
+    def __init__(self):
+        self._queue = []
+        self._cancelled = set()
+        self._next_id = 0
+
+    def after(self, ms, fn):
+        self._next_id += 1
+        heapq.heappush(self._queue, (time.perf_counter() + ms / 1000.0, self._next_id, fn))
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self._cancelled.add(after_id)
+
+    def run(self, until):
+        while self._queue and self._queue[0][0] < until:
+            due, after_id, fn = heapq.heappop(self._queue)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            fn()
+
+
+def measure_headless(coalesce, running, seconds=2.0, interval_ms=1, objects=1000):
+    """The same drag without Tk; returns (events/s, redraws/s)."""
+    from benchmark import StubCanvas
+    from canvas_renderer import CanvasSwarmRenderer
+    from engine import MotionEngine
+
+    loop = EventLoop()
+    engine = MotionEngine(count=objects, seed=0)
+    engine.set_bounds(945, 525)
+    engine.start_idle()
+    engine.step(1.0)
+    renderer = CanvasSwarmRenderer(StubCanvas(), "#1f6aa5")
+    renderer.set_count(objects)
+    state = {"running": running, "redraws": 0}
+
+    def redraw():
+        renderer.draw(engine.x, engine.y)
+        state["redraws"] += 1
+
+    def apply(changes):
+        renderer.set_size(changes["size"])
+
+    settings = PendingSettings(loop, apply, lambda: state["running"], redraw,
+                               delay_ms=FLUSH_DELAY_MS, immediate=not coalesce)
+    t0 = time.perf_counter()
+    end = t0 + seconds
+
+    def frame():
+        settings.flush()
+        redraw()
+        loop.after(FLUSH_DELAY_MS, frame)
+
+    def fire():
+        phase = abs(((time.perf_counter() - t0) % 1.0) * 2.0 - 1.0)
+        settings.set("size", SIZES[0] + (SIZES[1] - SIZES[0]) * phase)
+        loop.after(interval_ms, fire)
+
+    if running:
+        loop.after(0, frame)
+    loop.after(0, fire)
+    loop.run(end)
+    spent = time.perf_counter() - t0
+    return settings.received / spent, state["redraws"] / spent
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure redraws per second during a control drag")
+    parser.add_argument("--control", choices=("size", "window"), default="size")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--interval-ms", type=int, default=1, help="delay between synthetic events")
+    parser.add_argument("--objects", type=int, default=1, help="movers on screen (more than 1 is swarm mode)")
+    parser.add_argument("--headless", action="store_true", help="drive the drag without Tk (size control only)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"{'animation':<10} {'changes':<10} {'events/s':>9} {'redraws/s':>10}")
+    for running in (False, True):
+        for coalesce in (False, True):
+            if args.headless:
+                events, redraws = measure_headless(coalesce, running, args.seconds,
+                                                   args.interval_ms, max(args.objects, 1))
+            else:
+                events, redraws = measure(coalesce, running, args.control, args.seconds,
+                                          args.interval_ms, args.objects)
+            print(f"{'running' if running else 'stopped':<10} {'coalesced' if coalesce else 'immediate':<10} "
+                  f"{events:9.0f} {redraws:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
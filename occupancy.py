@@ -0,0 +1,192 @@
+"""
+Streaming occupancy heatmap of where the movers have been.
+Positions (turtle coordinates, origin at the center, y up) are binned into a
+fixed-cell NumPy grid covering the playfield. Each sample costs O(1), a canvas
+resize rebins the counts into the new extent, and grids from separate runs
+can be merged, saved as .npz / .npy / image, or rendered as an overlay.
+
+Headless use, e.g. an hour of motion sampled at 60 Hz:
+
+    python occupancy.py --seconds 3600 --out coverage.png --npz run1.npz
+    python occupancy.py --merge run1.npz run2.npz --out combined.png
+"""
+
+import argparse
+import math
+
+import numpy as np
+
+from engine import MotionEngine, playfield_bounds
+
+CELL_SIZE = 10.0
+SAMPLE_RATE = 60.0
+
+
+class OccupancyGrid:
+    def __init__(self, max_x, max_y, cell=CELL_SIZE):
+        self.cell = float(cell)
+        self.max_x = 0.0
+        self.max_y = 0.0
+        self.counts = np.zeros((1, 1))
+        self.resize(max_x, max_y)
+
+    @property
+    def shape(self):
+        return self.counts.shape
+
+    @property
+    def samples(self):
+        return float(self.counts.sum())
+
+    def _cells(self, max_x, max_y):
+        ny = max(1, int(math.ceil(2.0 * max_y / self.cell)))
+        nx = max(1, int(math.ceil(2.0 * max_x / self.cell)))
+        return ny, nx
+
+    def _index(self, x, y):
+        # Row 0 is the bottom edge; positions outside the extent land in the edge cells.
+        ny, nx = self.counts.shape
+        col = np.clip(((np.asarray(x) + self.max_x) // self.cell).astype(np.intp), 0, nx - 1)
+        row = np.clip(((np.asarray(y) + self.max_y) // self.cell).astype(np.intp), 0, ny - 1)
+        return row, col
+
+    def add(self, x, y, weight=1.0):
+        """Bin one position or a batch of positions."""
+        row, col = self._index(x, y)
+        if row.ndim == 0:
+            self.counts[row, col] += weight
+        else:
+            np.add.at(self.counts, (row, col), weight)
+
+    def _centers(self):
+        ny, nx = self.counts.shape
+        xs = (np.arange(nx) + 0.5) * self.cell - self.max_x
+        ys = (np.arange(ny) + 0.5) * self.cell - self.max_y
+        return np.meshgrid(xs, ys)
+
+    def resize(self, max_x, max_y):
+        """Change the playfield extent, moving existing counts into the new cells."""
+        max_x = max(float(max_x), 0.0)
+        max_y = max(float(max_y), 0.0)
+        if (max_x, max_y) == (self.max_x, self.max_y):
+            return
+        old = self.counts
+        cx, cy = self._centers()
+        self.max_x, self.max_y = max_x, max_y
+        self.counts = np.zeros(self._cells(max_x, max_y))
+        live = old > 0
+        if live.any():
+            self.add(cx[live], cy[live], old[live])
+
+    def merge(self, other):
+        """Add another grid's counts into this one, rebinning if the geometry differs."""
+        if other.cell == self.cell and other.shape == self.shape \
+                and (other.max_x, other.max_y) == (self.max_x, self.max_y):
+            self.counts += other.counts
+            return
+        cx, cy = other._centers()
+        live = other.counts > 0
+        if live.any():
+            self.add(cx[live], cy[live], other.counts[live])
+
+    def clear(self):
+        self.counts[:] = 0.0
+
+    def summary(self):
+        """Fraction of cells visited and how evenly the time is spread (coefficient of variation)."""
+        total = self.counts.sum()
+        mean = self.counts.mean()
+        return {
+            "samples": float(total),
+            "covered": float(np.count_nonzero(self.counts)) / self.counts.size,
+            "cv": float(self.counts.std() / mean) if mean > 0 else 0.0,
+        }
+
+    def to_rgb(self, color=(255, 80, 0), background=(0, 0, 0)):
+        """Heatmap as an (rows, cols, 3) uint8 array, top row first like the screen."""
+        peak = self.counts.max()
+        level = np.sqrt(self.counts / peak) if peak > 0 else np.zeros_like(self.counts)
+        level = level[::-1, :, None]
+        bg = np.asarray(background, dtype=np.float64)
+        fg = np.asarray(color, dtype=np.float64)
+        return (bg + (fg - bg) * level).round().astype(np.uint8)
+
+    def to_ppm(self, **kwargs):
+        """Binary PPM bytes, which Tk's PhotoImage reads without Pillow."""
+        rgb = self.to_rgb(**kwargs)
+        rows, cols = rgb.shape[:2]
+        return b"P6 %d %d 255\n" % (cols, rows) + rgb.tobytes()
+
+    def save(self, path):
+        """Write .npz (counts plus geometry, reloadable), .npy (counts only) or an image."""
+        if path.endswith(".npz"):
+            np.savez_compressed(path, counts=self.counts, cell=self.cell,
+                                max_x=self.max_x, max_y=self.max_y)
+        elif path.endswith(".npy"):
+            np.save(path, self.counts)
+        else:
+            from PIL import Image
+            img = Image.fromarray(self.to_rgb())
+            scale = max(1, int(self.cell))
+            img.resize((img.width * scale, img.height * scale), Image.NEAREST).save(path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            grid = cls(float(data["max_x"]), float(data["max_y"]), float(data["cell"]))
+            grid.counts[:] = data["counts"]
+        return grid
+
+
+def accumulate(seconds, width, height, size=24, count=1, speed=None, seed=None,
+               sample_rate=SAMPLE_RATE, cell=CELL_SIZE):
+    """Run the engine headless and bin every mover's position ``sample_rate`` times a second."""
+    engine = MotionEngine(count=count, seed=seed)
+    if speed is not None:
+        engine.speed = float(speed)
+    engine.set_bounds(*playfield_bounds(width, height, size))
+    grid = OccupancyGrid(engine.max_x, engine.max_y, cell)
+    interval = 1.0 / sample_rate
+    for _ in range(int(round(seconds * sample_rate))):
+        grid.add(engine.x, engine.y)
+        engine.advance(interval)
+    return grid
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how evenly the random motion covers the screen")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--size", type=int, default=24)
+    parser.add_argument("--seconds", type=float, default=600.0)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--speed", type=float, help="pixels per second")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--sample-rate", type=float, default=SAMPLE_RATE)
+    parser.add_argument("--cell", type=float, default=CELL_SIZE, help="grid cell size in pixels")
+    parser.add_argument("--merge", nargs="+", metavar="NPZ",
+                        help="combine saved grids instead of simulating")
+    parser.add_argument("--out", metavar="PATH", help="write the heatmap image here")
+    parser.add_argument("--npz", metavar="PATH", help="write the raw grid here for later merging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.merge:
+        grid = OccupancyGrid.load(args.merge[0])
+        for path in args.merge[1:]:
+            grid.merge(OccupancyGrid.load(path))
+    else:
+        grid = accumulate(args.seconds, args.width, args.height, size=args.size, count=args.count,
+                          speed=args.speed, seed=args.seed, sample_rate=args.sample_rate, cell=args.cell)
+    s = grid.summary()
+    print(f"samples {s['samples']:.0f}  covered {s['covered']:.1%}  cv {s['cv']:.3f}")
+    if args.out:
+        grid.save(args.out)
+    if args.npz:
+        grid.save(args.npz)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Drift-free fixed-timestep scheduler for Tk animation loops.
+The simulation always advances in fixed ``step`` increments measured on
+``time.perf_counter()``; a late callback is caught up with a bounded number
+of extra steps, and the next ``after`` delay is shortened by the time already
+spent so frames stay on a steady cadence. StepAccumulator holds the catch-up
+rule on its own, for loops that are not driven by Tk (the simulation thread).
+"""
+
+import time
+
+SIM_STEP = 1.0 / 120.0
+FRAME_INTERVAL = 1.0 / 60.0
+MAX_CATCHUP_STEPS = 8
+
+
+class StepAccumulator:
+    """Turns elapsed time into whole fixed steps, at most ``max_steps`` per call."""
+
+    def __init__(self, step=SIM_STEP, max_steps=MAX_CATCHUP_STEPS):
+        self.step = float(step)
+        self.max_steps = int(max_steps)
+        self.pending = 0.0
+        self.dropped_time = 0.0
+
+    def reset(self):
+        self.pending = 0.0
+
+    def run(self, elapsed, update):
+        """Add ``elapsed`` seconds and call ``update(step)`` for each whole step; returns the count."""
+        self.pending += elapsed
+        steps = 0
+        while self.pending >= self.step and steps < self.max_steps:
+            update(self.step)
+            self.pending -= self.step
+            steps += 1
+        if self.pending >= self.step:
+            # Too far behind to catch up; drop the backlog instead of spiralling.
+            self.dropped_time += self.pending - self.pending % self.step
+            self.pending %= self.step
+        return steps
+
+
+class FixedStepScheduler:
+    def __init__(self, widget, update, render, step=SIM_STEP,
+                 frame_interval=FRAME_INTERVAL, max_steps=MAX_CATCHUP_STEPS,
+                 clock=time.perf_counter, timings=None):
+        self.widget = widget
+        self.update = update
+        self.render = render
+        self.frame_interval = float(frame_interval)
+        self.clock = clock
+        self.timings = timings
+        self.steps = StepAccumulator(step, max_steps)
+
+        self.running = False
+        self.lateness = 0.0
+        self.steps_last_frame = 0
+        self._after_id = None
+        self._last = 0.0
+        self._next_due = 0.0
+
+    @property
+    def step(self):
+        return self.steps.step
+
+    @property
+    def dropped_time(self):
+        return self.steps.dropped_time
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        now = self.clock()
+        self._last = now
+        self._next_due = now + self.frame_interval
+        self.steps.reset()
+        self._schedule(now)
+
+    def stop(self):
+        self.running = False
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self, now):
+        delay_ms = max(0, int((self._next_due - now) * 1000.0))
+        self._after_id = self.widget.after(delay_ms, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        if not self.running:
+            return
+
+        timings = self.timings
+        if timings is not None:
+            timings.begin_frame()
+
+        now = self.clock()
+        self.lateness = max(0.0, now - self._next_due)
+        self.steps_last_frame = self.steps.run(now - self._last, self.update)
+        self._last = now
+
+        if timings is not None:
+            timings.record("lateness", self.lateness)
+            timings.record("simulation", self.clock() - now)
+
+        self.render()
+
+        if timings is not None:
+            timings.end_frame()
+
+        self._next_due += self.frame_interval
+        if self._next_due <= now:
+            self._next_due = now + self.frame_interval
+        if self.running:
+            self._schedule(self.clock())
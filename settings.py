@@ -0,0 +1,52 @@
+"""
+Coalesced control-panel changes.
+Slider, menu and resize callbacks only record the latest value per setting.
+The pending batch is applied once at the top of the next animation frame, or,
+while the animation is stopped, once per short delay, so a drag that fires
+hundreds of callbacks costs at most one redraw per frame.
+"""
+
+FLUSH_DELAY_MS = 16
+
+
+class PendingSettings:
+    def __init__(self, widget, apply, is_running, redraw, delay_ms=FLUSH_DELAY_MS, immediate=False):
+        self.widget = widget
+        self.apply = apply
+        self.is_running = is_running
+        self.redraw = redraw
+        self.delay_ms = int(delay_ms)
+        # Immediate mode applies and redraws on every change (the old behaviour, for comparison).
+        self.immediate = immediate
+        self.pending = {}
+        self.received = 0
+        self.batches = 0
+        self._after_id = None
+
+    def set(self, key, value=None):
+        """Record the latest value for ``key``; later calls before a flush overwrite it."""
+        self.pending[key] = value
+        self.received += 1
+        if self.immediate:
+            if self.flush():
+                self.redraw()
+        elif not self.is_running() and self._after_id is None:
+            # Throttle rather than debounce, so a long drag still redraws every delay_ms.
+            self._after_id = self.widget.after(self.delay_ms, self._flush_idle)
+
+    def flush(self):
+        """Apply everything pending in one batch; returns whether anything changed."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if not self.pending:
+            return False
+        changes, self.pending = self.pending, {}
+        self.apply(changes)
+        self.batches += 1
+        return True
+
+    def _flush_idle(self):
+        self._after_id = None
+        if self.flush():
+            self.redraw()
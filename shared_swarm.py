@@ -0,0 +1,255 @@
+"""
+Mover population sharded across worker processes over shared memory.
+Each worker runs a MotionEngine whose x / y / heading arrays are views into
+its slice of one multiprocessing.shared_memory block. The owner publishes
+the tick parameters into a small control area and releases all workers
+through a barrier; a second barrier marks the tick as finished, after which
+every position can be read zero-copy from the block until the next tick.
+
+SharedSwarm mirrors the parts of MotionEngine the app drives (step, advance,
+bounds, speed, pause, reset), so it can stand in for it. Headless benchmark:
+
+    python shared_swarm.py --count 1000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import signal
+import time
+from multiprocessing import get_context, shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from engine import MAX_DISTANCE, MIN_DISTANCE, PAUSE_ON_TURN, REDIRECT_STEP, SPEED, MotionEngine
+
+# Control area layout (float64 slots)
+CMD, DT, SPEED_SLOT, PAUSE_SLOT, MAX_X, MAX_Y, RESET_SEQ, RELEASE_SEQ = range(8)
+CONTROL_SLOTS = 8
+CMD_STEP, CMD_ADVANCE, CMD_IDLE, CMD_STOP = 0.0, 1.0, 2.0, 3.0
+
+TICK_TIMEOUT_S = 10.0
+JOIN_TIMEOUT_S = 5.0
+
+
+def _layout(count):
+    # x, y and heading arrays followed by the control area
+    return 3 * count + CONTROL_SLOTS
+
+
+def _views(buf, count):
+    block = np.ndarray((_layout(count),), dtype=np.float64, buffer=buf)
+    return block[:count], block[count:2 * count], block[2 * count:3 * count], block[3 * count:]
+
+
+def _worker(name, count, lo, hi, params, seed, start, done):
+    # Ctrl-C belongs to the owner; it shuts workers down through the control area.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        x, y, heading, ctrl = _views(shm.buf, count)
+        engine = MotionEngine(count=hi - lo, seed=seed, **params)
+        # The engine only updates these in place, so they stay views into the block.
+        engine.x = x[lo:hi]
+        engine.y = y[lo:hi]
+        engine.heading = heading[lo:hi]
+        bounds = (None, None)
+        reset_seq = ctrl[RESET_SEQ]
+        release_seq = ctrl[RELEASE_SEQ]
+        while True:
+            start.wait()
+            cmd = ctrl[CMD]
+            if cmd == CMD_STOP:
+                break
+            engine.speed = ctrl[SPEED_SLOT]
+            engine.pause = ctrl[PAUSE_SLOT]
+            if (ctrl[MAX_X], ctrl[MAX_Y]) != bounds:
+                bounds = (ctrl[MAX_X], ctrl[MAX_Y])
+                engine.set_bounds(*bounds)
+            if ctrl[RESET_SEQ] != reset_seq:
+                reset_seq = ctrl[RESET_SEQ]
+                engine.reset()
+            if ctrl[RELEASE_SEQ] != release_seq:
+                release_seq = ctrl[RELEASE_SEQ]
+                engine.end_pauses()
+            if cmd == CMD_STEP:
+                engine.step(ctrl[DT])
+            elif cmd == CMD_ADVANCE:
+                engine.advance(ctrl[DT])
+            done.wait()
+        # Release every view into the block before closing it.
+        del x, y, heading, ctrl, engine
+    finally:
+        shm.close()
+
+
+class SharedSwarm:
+    def __init__(self, count, workers=None, speed=SPEED, pause=PAUSE_ON_TURN,
+                 min_distance=MIN_DISTANCE, max_distance=MAX_DISTANCE,
+                 redirect_step=REDIRECT_STEP, seed=None):
+        self.seed = seed
+        self.time = 0.0
+        workers = max(1, min(int(workers or os.cpu_count() or 1), int(count)))
+        self._count = int(count)
+        self._shm = shared_memory.SharedMemory(create=True, size=_layout(self._count) * 8)
+        self.x, self.y, self.heading, self._ctrl = _views(self._shm.buf, self._count)
+        self.x[:] = 0.0
+        self.y[:] = 0.0
+        self.heading[:] = 0.0
+        self._ctrl[:] = 0.0
+        self._ctrl[SPEED_SLOT] = speed
+        self._ctrl[PAUSE_SLOT] = pause
+
+        ctx = get_context()
+        self._start = ctx.Barrier(workers + 1)
+        self._done = ctx.Barrier(workers + 1)
+        params = dict(min_distance=min_distance, max_distance=max_distance, redirect_step=redirect_step)
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        edges = np.linspace(0, self._count, workers + 1).astype(int)
+        self._procs = [
+            ctx.Process(target=_worker, name=f"swarm-{i}", daemon=True,
+                        args=(self._shm.name, self._count, int(edges[i]), int(edges[i + 1]),
+                              params, seeds[i], self._start, self._done))
+            for i in range(workers)
+        ]
+        for p in self._procs:
+            p.start()
+        self.closed = False
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def workers(self):
+        return len(self._procs)
+
+    @property
+    def speed(self):
+        return float(self._ctrl[SPEED_SLOT])
+
+    @speed.setter
+    def speed(self, value):
+        self._ctrl[SPEED_SLOT] = value
+
+    @property
+    def pause(self):
+        return float(self._ctrl[PAUSE_SLOT])
+
+    @pause.setter
+    def pause(self, value):
+        self._ctrl[PAUSE_SLOT] = value
+
+    @property
+    def max_x(self):
+        return float(self._ctrl[MAX_X])
+
+    @property
+    def max_y(self):
+        return float(self._ctrl[MAX_Y])
+
+    # Settings changes take effect through an empty tick, so positions are
+    # up to date on return just as with MotionEngine.
+
+    def set_bounds(self, max_x, max_y):
+        self._ctrl[MAX_X] = max(float(max_x), 0.0)
+        self._ctrl[MAX_Y] = max(float(max_y), 0.0)
+        self.sync()
+
+    def reset(self):
+        self._ctrl[RESET_SEQ] += 1
+        self.sync()
+
+    def end_pauses(self):
+        self._ctrl[RELEASE_SEQ] += 1
+        self.sync()
+
+    def start_idle(self):
+        # Idle movers pick a segment on their first step anyway.
+        pass
+
+    def _tick(self, cmd, dt):
+        if self.closed:
+            raise RuntimeError("shared swarm is closed")
+        self._ctrl[CMD] = cmd
+        self._ctrl[DT] = dt
+        try:
+            self._start.wait(TICK_TIMEOUT_S)
+            self._done.wait(TICK_TIMEOUT_S)
+        except BrokenBarrierError:
+            self.close()
+            raise RuntimeError("a shared swarm worker stopped responding")
+        self.time += dt
+
+    def step(self, dt):
+        """Fixed step on every shard; positions are complete when this returns."""
+        self._tick(CMD_STEP, dt)
+
+    def advance(self, duration):
+        """Event-driven fast-forward on every shard (see MotionEngine.advance)."""
+        self._tick(CMD_ADVANCE, duration)
+
+    def sync(self):
+        """Apply pending settings on every shard without moving time forward."""
+        self._tick(CMD_IDLE, 0.0)
+
+    def close(self):
+        """Stop the workers and free the shared block; safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        self._ctrl[CMD] = CMD_STOP
+        try:
+            self._start.wait(JOIN_TIMEOUT_S)
+        except BrokenBarrierError:
+            pass
+        for p in self._procs:
+            p.join(JOIN_TIMEOUT_S)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        # Drop our views before closing, or the buffer export keeps the block alive.
+        self.x = self.y = self.heading = self._ctrl = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark(count, workers, seconds=2.0, dt=1.0 / 120.0):
+    """Steps per second for ``count`` movers on ``workers`` processes."""
+    with SharedSwarm(count, workers=workers, seed=0) as swarm:
+        swarm.set_bounds(945, 525)
+        swarm.step(dt)
+        ticks = 0
+        t0 = time.perf_counter()
+        while time.perf_counter() - t0 < seconds:
+            swarm.step(dt)
+            ticks += 1
+        return ticks / (time.perf_counter() - t0)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sharded shared-memory swarm")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    base = None
+    for workers in args.workers:
+        rate = benchmark(args.count, workers, args.seconds)
+        base = base or rate
+        print(f"{workers:>3} workers: {rate:8.1f} steps/s  "
+              f"{rate * args.count / 1e6:8.1f} M mover-steps/s  x{rate / base:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Simulation on a dedicated worker thread, decoupled from the Tk event loop.
+The worker advances the engine in fixed steps at its own rate and publishes
+position snapshots into a triple buffer. The Tk side copies the latest one
+on each frame without taking a lock; a sequence number written around every
+publish (a seqlock) lets it detect the rare copy that raced a rewrite and
+retry. Control-panel changes travel the other way through a queue and are
+applied by the worker between steps, so the engine is only ever touched
+from one thread.
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+from scheduler import MAX_CATCHUP_STEPS, SIM_STEP, StepAccumulator
+
+READ_RETRIES = 3
+
+
+class Snapshot:
+    """Positions and headings of every mover at one simulation time."""
+
+    def __init__(self, capacity=1):
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.heading = np.zeros(capacity)
+        self.count = 0
+        self.time = 0.0
+        self.seq = 0
+
+    def _fit(self, n):
+        if len(self.x) < n:
+            size = max(n, 2 * len(self.x))
+            self.x = np.zeros(size)
+            self.y = np.zeros(size)
+            self.heading = np.zeros(size)
+
+    def load(self, src):
+        """Copy positions from an engine or another snapshot."""
+        n = src.count
+        self._fit(n)
+        np.copyto(self.x[:n], src.x[:n])
+        np.copyto(self.y[:n], src.y[:n])
+        np.copyto(self.heading[:n], src.heading[:n])
+        self.count = n
+        self.time = src.time
+
+
+class SimulationThread:
+    def __init__(self, engine, update, step=SIM_STEP, max_steps=MAX_CATCHUP_STEPS,
+                 clock=time.perf_counter):
+        self.engine = engine
+        self.update = update
+        self.clock = clock
+        self.steps = StepAccumulator(step, max_steps)
+
+        self.running = False
+        self.steps_per_second = 0.0
+        self.step_cost = 0.0
+
+        self._buffers = [Snapshot(engine.count) for _ in range(3)]
+        self._back = 0
+        self._seq = 0
+        self.latest = self._buffers[2]
+        self._controls = queue.SimpleQueue()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self.publish()
+
+    @property
+    def step(self):
+        return self.steps.step
+
+    @property
+    def dropped_time(self):
+        return self.steps.dropped_time
+
+    def submit(self, fn, *args):
+        """Queue ``fn(*args)`` to run on the simulation thread before its next step."""
+        self._controls.put((fn, args))
+
+    def set_running(self, running):
+        self.submit(self._set_running, bool(running))
+
+    def _set_running(self, running):
+        self.running = running
+        self.steps.reset()
+        self._last = self.clock()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stopping = True
+        self.submit(lambda: None)
+        self._thread.join(timeout)
+
+    def publish(self):
+        """Write the engine state into the buffer nobody is reading and make it the latest."""
+        buf = self._buffers[self._back]
+        buf.seq = -1
+        buf.load(self.engine)
+        self._seq += 1
+        buf.seq = self._seq
+        # A single reference assignment is atomic, so readers see either the old or the new buffer.
+        self.latest = buf
+        self._back = (self._back + 1) % len(self._buffers)
+
+    def read(self, front):
+        """Copy the latest snapshot into ``front``; returns False if it kept racing the writer."""
+        for _ in range(READ_RETRIES):
+            snap = self.latest
+            seq = snap.seq
+            if seq < 0:
+                continue
+            front.load(snap)
+            if snap.seq == seq:
+                return True
+        return False
+
+    def _apply_controls(self, timeout):
+        try:
+            fn, args = self._controls.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        fn(*args)
+        # Drain whatever else arrived so a burst of slider events costs one publish.
+        while True:
+            try:
+                fn, args = self._controls.get_nowait()
+            except queue.Empty:
+                return True
+            fn(*args)
+
+    def _run(self):
+        self.steps.reset()
+        self._last = self.clock()
+        window_start = self._last
+        window_steps = 0
+        while not self._stopping:
+            if self.running:
+                wait = max(0.0, self.step - self.steps.pending - (self.clock() - self._last))
+            else:
+                wait = None
+            changed = self._apply_controls(wait)
+            if self._stopping:
+                break
+            if not self.running:
+                if changed:
+                    self.publish()
+                continue
+
+            now = self.clock()
+            steps = self.steps.run(now - self._last, self.update)
+            self._last = now
+            if steps or changed:
+                self.publish()
+
+            if steps:
+                spent = self.clock() - now
+                self.step_cost = spent / steps
+                window_steps += steps
+            if now - window_start >= 1.0:
+                self.steps_per_second = window_steps / (now - window_start)
+                window_start = now
+                window_steps = 0
@@ -4,11 +4,55 @@ Features randomly moving shapes with dynamic rotations, a visual shape selector,
 and a modern glassmorphism control panel with synced numeric/slider inputs and native fullscreen/exit support.
 """
 
+import json
+import os
+import secrets
+
 import streamlit as st
 
+from local_api import LocalApiServer
+from telemetry import FRAME_BUCKETS_MS, REPORT_INTERVAL_MS, TelemetryStore, telemetry_route
+from trajectory_stream import WaypointService, waypoint_route
+
+P5_LOCAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "p5.min.js")
+
+
+@st.cache_resource
+def p5_script_tag():
+    """Inline the vendored p5 build once per server process; raises OSError if it is missing."""
+    with open(P5_LOCAL_PATH, "r", encoding="utf-8") as f:
+        source = f.read()
+    # Keep the inlined source from closing the surrounding <script> element early.
+    return "<script>" + source.replace("</script", "<\\/script") + "</script>"
+
+
+@st.cache_resource
+def local_api_urls():
+    """Start the localhost API (telemetry, trajectory chunks) once per server process.
+
+    Returns the route URLs and the set of page origins allowed to read trajectory replies.
+    """
+    server = LocalApiServer()
+    server.route("POST", "/telemetry", telemetry_route(TelemetryStore()))
+    # Trajectory chunks are expensive to generate, so that route is only reachable through an
+    # unguessable path handed to our own page. The components iframe is same-origin with the
+    # Streamlit page, so replies are readable from the origins this app was actually served on.
+    origins = set()
+    trajectory_path = "/trajectory/" + secrets.token_urlsafe(16)
+    server.route("POST", trajectory_path, waypoint_route(WaypointService()), allow_origin=origins)
+    base_url = server.start().base_url
+    return {"telemetry": base_url + "/telemetry", "trajectory": base_url + trajectory_path, "origins": origins}
+
 # Configure Streamlit page layout
 st.set_page_config(layout="wide", page_title="Random Shape (Hero)")
 
+# The app must run offline, so there is no CDN fallback for p5.js
+try:
+    p5_script = p5_script_tag()
+except OSError as exc:
+    st.error(f"The vendored p5.js build is missing ({exc}). Run `python vendor_p5.py` and restart the app.")
+    st.stop()
+
 # Inject CSS to remove Streamlit paddings and force the iframe to fill the viewport
 st.markdown(
     """
@@ -52,7 +96,7 @@ html = r'''
   <head>
     <meta charset="utf-8">
     <title>Random Shape (Hero)</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.6.0/p5.min.js"></script>
+    __P5_SCRIPT__
     <style>
       /* Base and Canvas Setup */
       html, body { height: 100%; margin: 0; background: #2b2b2b; transition: background 0.3s ease; overflow: hidden; }
@@ -128,6 +172,10 @@ html = r'''
       button.primary:hover { box-shadow: 0 4px 12px rgba(39, 229, 138, 0.3); }
       button.danger:hover { background: rgba(235, 87, 87, 0.8); color: white; border-color: transparent;}
       
+      /* Quality governor readout; panel blur is the first thing dropped on slow GPUs */
+      .controls.no-blur { backdrop-filter: none; -webkit-backdrop-filter: none; background: rgba(30, 30, 30, 0.88); }
+      .perf-stats { font-size: 12px; color: #8fa8c7; font-variant-numeric: tabular-nums; text-align: right; }
+
       .checkbox-row { display:flex; align-items:center; justify-content: flex-start; gap:8px; color:#cfe8ff; font-size:14px; margin-top: 16px;}
       .checkbox-row input[type="checkbox"] { width: 16px; height: 16px; cursor: pointer; accent-color: #27e58a; }
 
@@ -166,6 +214,536 @@ html = r'''
   <body>
     <div id="sketch-holder"></div>
 
+    <script id="sim-src">
+      // Simulation, quality governor and sprite drawing shared by both sketch modes. The page runs
+      // this block before the main sketch, and worker mode prepends it to the worker's source.
+      // Each host declares `config` and implements applyQualityTier(tier) and showPerfStats(text).
+      const MAX_MOVERS = 10000;
+      const EDGE_MARGIN = 15;
+      const FULL_TURN = Math.PI * 2;
+
+      // Movers are stored structure-of-arrays in preallocated typed buffers.
+      // Times stay in a Float64Array because the millisecond clock outgrows float32 precision on long runs.
+      const posX = new Float32Array(MAX_MOVERS);
+      const posY = new Float32Array(MAX_MOVERS);
+      const heading = new Float32Array(MAX_MOVERS);
+      const remaining = new Float32Array(MAX_MOVERS);
+      const pausedUntil = new Float64Array(MAX_MOVERS);
+      // Positions at the previous simulation step, for render-time interpolation
+      const prevX = new Float32Array(MAX_MOVERS);
+      const prevY = new Float32Array(MAX_MOVERS);
+      let moverCount = 1;
+      let nextWakeAt = 0;
+
+      // Fixed-step simulation clock, independent of the display refresh rate
+      const SIM_STEP_MS = 1000 / 120;
+      const MAX_FRAME_MS = 250;
+      let simTime = 0;
+      let accumulator = 0;
+      let canvasW = 800, canvasH = 600;
+      let rand = Math.random;
+
+      /**
+       * Small seeded PRNG (mulberry32); both modes draw from it, so ?seed= gives the same motion either way.
+       */
+      function seededRandom(seed) {
+        let a = seed >>> 0;
+        return () => {
+          a = (a + 0x6D2B79F5) >>> 0;
+          let t = a;
+          t = Math.imul(t ^ (t >>> 15), t | 1);
+          t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+          return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+        };
+      }
+
+      /**
+       * Makes movement reproducible for a seed, or unseeded again for null.
+       */
+      function seedMovement(seed) {
+        rand = seed === null ? Math.random : seededRandom(seed);
+      }
+
+      /**
+       * Distance from each canvas edge to the furthest a mover's centre may go.
+       */
+      function edgeOffset() {
+        return EDGE_MARGIN + config.dot_size / 2;
+      }
+
+      /**
+       * Centers movers [from, to) on the canvas and clears their movement state.
+       */
+      function resetMovers(from, to) {
+        posX.fill(canvasW / 2, from, to);
+        posY.fill(canvasH / 2, from, to);
+        heading.fill(0, from, to);
+        remaining.fill(0, from, to);
+        pausedUntil.fill(0, from, to);
+        prevX.fill(canvasW / 2, from, to);
+        prevY.fill(canvasH / 2, from, to);
+      }
+
+      /**
+       * Changes the number of live movers; new ones start idle at the center.
+       */
+      function setMoverCount(n) {
+        n = Math.min(Math.max(Math.floor(n) || 1, 1), MAX_MOVERS);
+        if (n > moverCount) resetMovers(moverCount, n);
+        moverCount = n;
+      }
+
+      /**
+       * Assigns mover i a random trajectory angle and travel distance based on screen proportions.
+       */
+      function pickNewMovement(i, now) {
+        heading[i] = rand() * FULL_TURN;
+        const diag = Math.hypot(canvasW, canvasH);
+        const dynMin = Math.min(100, diag * 0.1);
+        const dynMax = Math.min(600, diag * 0.6);
+        remaining[i] = dynMin + rand() * (dynMax - dynMin);
+        pausedUntil[i] = now + config.pause_ms;
+      }
+
+      /**
+       * Enforces boundaries by snapping every mover back inside the margin limits dynamically based on size.
+       */
+      function clampMovers() {
+        const offset = edgeOffset();
+        const maxX = canvasW / 2 - offset;
+        const maxY = canvasH / 2 - offset;
+        const centerX = canvasW / 2, centerY = canvasH / 2;
+
+        for (let i = 0; i < moverCount; i++) {
+          posX[i] = centerX + Math.min(Math.max(posX[i] - centerX, -maxX), maxX);
+          posY[i] = centerY + Math.min(Math.max(posY[i] - centerY, -maxY), maxY);
+        }
+        prevX.set(posX);
+        prevY.set(posY);
+      }
+
+      /**
+       * Advances every mover by dt seconds in a single tight loop over the typed buffers.
+       */
+      function updateMovers(now, dt) {
+        const offset = edgeOffset();
+        const maxX = canvasW / 2 - offset;
+        const maxY = canvasH / 2 - offset;
+        const centerX = canvasW / 2, centerY = canvasH / 2;
+        const speed = config.speed * dt;
+        let wakeAt = Infinity;
+
+        for (let i = 0; i < moverCount; i++) {
+          if (now < pausedUntil[i]) {
+            if (pausedUntil[i] < wakeAt) wakeAt = pausedUntil[i];
+            continue;
+          }
+          if (remaining[i] <= 0) {
+            pickNewMovement(i, now);
+            if (pausedUntil[i] < wakeAt) wakeAt = pausedUntil[i];
+            continue;
+          }
+
+          const step = remaining[i] < speed ? remaining[i] : speed;
+          let relX = posX[i] + Math.cos(heading[i]) * step - centerX;
+          let relY = posY[i] + Math.sin(heading[i]) * step - centerY;
+          remaining[i] -= step;
+          let hitEdge = false;
+
+          if (relX >= maxX) { relX = maxX; hitEdge = true; }
+          if (relX <= -maxX) { relX = -maxX; hitEdge = true; }
+          if (relY >= maxY) { relY = maxY; hitEdge = true; }
+          if (relY <= -maxY) { relY = -maxY; hitEdge = true; }
+
+          posX[i] = centerX + relX;
+          posY[i] = centerY + relY;
+
+          if (hitEdge) {
+            remaining[i] = 0;
+            pausedUntil[i] = now + config.pause_ms;
+            if (pausedUntil[i] < wakeAt) wakeAt = pausedUntil[i];
+          } else {
+            wakeAt = now;
+          }
+        }
+        nextWakeAt = wakeAt;
+      }
+
+      /**
+       * Runs as many fixed steps of update(now, dt) as elapsed milliseconds cover and
+       * returns how far into the next step the display currently is (0..1).
+       */
+      function stepSimulation(elapsed, update) {
+        accumulator += Math.min(elapsed, MAX_FRAME_MS);
+        while (accumulator >= SIM_STEP_MS) {
+          prevX.set(posX);
+          prevY.set(posY);
+          simTime += SIM_STEP_MS;
+          update(simTime, SIM_STEP_MS / 1000);
+          accumulator -= SIM_STEP_MS;
+        }
+        return accumulator / SIM_STEP_MS;
+      }
+
+      // Quality tiers, cheapest first; the governor moves between them based on measured frame times
+      const QUALITY_TIERS = [
+        { name: 'Minimal', density: 1, glow: 0, heartStep: 0.3, panelBlur: false },
+        { name: 'Reduced', density: 1, glow: 0.75, heartStep: 0.15, panelBlur: false },
+        { name: 'No panel blur', density: 0, glow: 1.5, heartStep: 0.05, panelBlur: false },
+        { name: 'Full', density: 0, glow: 1.5, heartStep: 0.05, panelBlur: true }
+      ];
+      let frameBudgetMs = 1000 / 60;
+      const GOVERNOR_WINDOW = 120;
+      const GOVERNOR_MIN_SAMPLES = 30;
+      const DOWNGRADE_HOLD_MS = 1000;
+      const UPGRADE_HOLD_MS = 4000;
+      const STATS_REFRESH_MS = 500;
+      let qualityTier = QUALITY_TIERS.length - 1;
+      const governor = {
+        intervals: new Float32Array(GOVERNOR_WINDOW),
+        work: new Float32Array(GOVERNOR_WINDOW),
+        index: 0, samples: 0, intervalSum: 0, workSum: 0,
+        overSince: 0, underSince: 0, lastStats: 0, skip: true
+      };
+
+      /**
+       * Sets the governor's frame budget from an FPS cap (0 = uncapped).
+       */
+      function setFrameBudget(fpsCap) {
+        frameBudgetMs = 1000 / (fpsCap > 0 ? Math.min(fpsCap, 60) : 60);
+      }
+
+      /**
+       * Starts measuring afresh, e.g. at a new tier.
+       */
+      function resetGovernor() {
+        governor.samples = 0; governor.index = 0;
+        governor.intervalSum = 0; governor.workSum = 0;
+        governor.overSince = 0; governor.underSince = 0;
+        governor.skip = true;
+      }
+
+      /**
+       * Records one frame and steps quality down when over budget or up when there is headroom.
+       * Downgrades need a sustained overrun and upgrades a longer spell of headroom (hysteresis).
+       */
+      function governQuality(intervalMs, workMs) {
+        const g = governor;
+        if (g.skip) { g.skip = false; return; }
+        if (g.samples === GOVERNOR_WINDOW) {
+          g.intervalSum -= g.intervals[g.index];
+          g.workSum -= g.work[g.index];
+        } else {
+          g.samples++;
+        }
+        g.intervals[g.index] = intervalMs;
+        g.work[g.index] = workMs;
+        g.intervalSum += intervalMs;
+        g.workSum += workMs;
+        g.index = (g.index + 1) % GOVERNOR_WINDOW;
+
+        const now = performance.now();
+        const avgInterval = g.intervalSum / g.samples;
+        const avgWork = g.workSum / g.samples;
+        if (now - g.lastStats > STATS_REFRESH_MS) {
+          g.lastStats = now;
+          const sorted = Array.from(g.intervals.subarray(0, g.samples)).sort((a, b) => a - b);
+          const p95 = sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * 0.95))];
+          showPerfStats(`${avgInterval.toFixed(1)} ms avg · ${p95.toFixed(1)} p95 · ${avgWork.toFixed(1)} draw`);
+        }
+        if (g.samples < GOVERNOR_MIN_SAMPLES) return;
+
+        // Frame interval catches compositor cost (blur, HiDPI); draw time shows our own headroom
+        const over = avgInterval > frameBudgetMs * 1.2;
+        const under = avgInterval < frameBudgetMs * 1.05 && avgWork < frameBudgetMs * 0.4;
+        g.overSince = over ? (g.overSince || now) : 0;
+        g.underSince = under ? (g.underSince || now) : 0;
+
+        if (over && qualityTier > 0 && now - g.overSince > DOWNGRADE_HOLD_MS) {
+          applyQualityTier(qualityTier - 1);
+        } else if (under && qualityTier < QUALITY_TIERS.length - 1 && now - g.underSince > UPGRADE_HOLD_MS) {
+          applyQualityTier(qualityTier + 1);
+        }
+      }
+
+      // Offscreen sprite per (shape, size, color, pixel density, quality), least recently used first
+      const SPRITE_CACHE_MAX = 24;
+      const spriteCache = new Map();
+
+      /**
+       * A blank canvas to render a sprite into, on either thread.
+       */
+      function createSpriteCanvas(w, h) {
+        if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(w, h);
+        const c = document.createElement('canvas');
+        c.width = w;
+        c.height = h;
+        return c;
+      }
+
+      /**
+       * Outline of one shape, centred on the origin; heartStep sets how finely the heart is traced.
+       */
+      function shapePath(shape, size, heartStep) {
+        const p = new Path2D();
+        if (shape === 'square') {
+          const h = size / 2;
+          if (p.roundRect) p.roundRect(-h, -h, size, size, size * 0.25); else p.rect(-h, -h, size, size);
+        } else if (shape === 'triangle') {
+          p.moveTo(0, -size / 1.5); p.lineTo(-size / 2, size / 2); p.lineTo(size / 2, size / 2); p.closePath();
+        } else if (shape === 'star') {
+          const step = FULL_TURN / 5;
+          for (let k = 0; k < 5; k++) {
+            const a = -Math.PI / 2 + k * step;
+            p.lineTo(Math.cos(a) * size, Math.sin(a) * size);
+            p.lineTo(Math.cos(a + step / 2) * size / 2.5, Math.sin(a + step / 2) * size / 2.5);
+          }
+          p.closePath();
+        } else if (shape === 'heart') {
+          // Parametric heart curve
+          for (let a = 0; a < FULL_TURN; a += heartStep) {
+            const hx = 16 * Math.pow(Math.sin(a), 3);
+            const hy = -(13 * Math.cos(a) - 5 * Math.cos(2 * a) - 2 * Math.cos(3 * a) - Math.cos(4 * a));
+            p.lineTo(hx * size * 0.03, hy * size * 0.03 - size * 0.15);
+          }
+          p.closePath();
+        } else {
+          p.arc(0, 0, size / 2, 0, FULL_TURN);
+        }
+        return p;
+      }
+
+      /**
+       * Renders one shape, unrotated and centred, into a new offscreen buffer.
+       */
+      function renderSprite(shape, size, color, density, quality) {
+        // Glow needs room for the shadow blur; star points reach a full size from the centre
+        const extent = Math.ceil(shape === 'glow' ? size * 5 : size * 2 + 4);
+        const canvas = createSpriteCanvas(Math.ceil(extent * density), Math.ceil(extent * density));
+        const g = canvas.getContext('2d');
+        g.scale(density, density);
+        g.translate(extent / 2, extent / 2);
+        g.fillStyle = color;
+        g.strokeStyle = color;
+        const p = shapePath(shape, size, quality.heartStep);
+
+        if (shape === 'glow') {
+          if (quality.glow > 0) {
+            g.shadowBlur = size * quality.glow * density;
+            g.shadowColor = color;
+          } else {
+            // Cheapest glow: a translucent halo instead of a shadow blur
+            g.globalAlpha = 70 / 255;
+            g.fill(shapePath('circle', size * 2));
+            g.globalAlpha = 1;
+          }
+        }
+        if (shape === 'ring') {
+          g.lineWidth = size * 0.2;
+          g.stroke(p);
+        } else {
+          g.fill(p);
+        }
+        return { canvas: canvas, w: extent, h: extent };
+      }
+
+      /**
+       * Returns the cached sprite for the current look, rendering and evicting as needed.
+       */
+      function getSprite(shape, size, color, density) {
+        const key = shape + '|' + size + '|' + color + '|' + density + '|' + qualityTier;
+        let sprite = spriteCache.get(key);
+        if (sprite) {
+          // Re-insert to mark as most recently used
+          spriteCache.delete(key);
+          spriteCache.set(key, sprite);
+          return sprite;
+        }
+        sprite = renderSprite(shape, size, color, density, QUALITY_TIERS[qualityTier]);
+        spriteCache.set(key, sprite);
+        if (spriteCache.size > SPRITE_CACHE_MAX) spriteCache.delete(spriteCache.keys().next().value);
+        return sprite;
+      }
+
+      /**
+       * Shared rotation for tumbling shapes at time t (ms); arrows are rotated per mover instead.
+       */
+      function spriteRotation(shape, t) {
+        if (shape === 'square') return t / 1500.0;
+        if (shape === 'star') return t / 1000.0;
+        return 0;
+      }
+
+      /**
+       * Strokes the faint rectangular bounding box limit onto a 2D context at pixel density d.
+       */
+      function drawBoundary(ctx, d) {
+        const offset = edgeOffset();
+        ctx.save();
+        ctx.setTransform(d, 0, 0, d, 0, 0);
+        ctx.strokeStyle = 'rgba(255, 255, 255, 0.47)';
+        ctx.lineWidth = 1.5;
+        ctx.beginPath();
+        if (ctx.roundRect) ctx.roundRect(offset, offset, canvasW - offset * 2, canvasH - offset * 2, 6);
+        else ctx.rect(offset, offset, canvasW - offset * 2, canvasH - offset * 2);
+        ctx.stroke();
+        ctx.restore();
+      }
+
+      /**
+       * Blits the cached sprite for every mover straight onto a 2D context at pixel density d in
+       * one pass, interpolating a fraction alpha of the way from the previous to the current step.
+       */
+      function drawMovers(ctx, d, alpha, t) {
+        const sprite = getSprite(config.shape, config.dot_size, config.color, d);
+        const src = sprite.canvas;
+        const w = sprite.w, h = sprite.h;
+        const hw = w / 2, hh = h / 2;
+
+        if (config.shape === 'triangle') {
+          // Orient arrows to face their own direction of travel
+          for (let i = 0; i < moverCount; i++) {
+            const a = heading[i] + Math.PI / 2;
+            const c = Math.cos(a) * d, s = Math.sin(a) * d;
+            const x = prevX[i] + (posX[i] - prevX[i]) * alpha;
+            const y = prevY[i] + (posY[i] - prevY[i]) * alpha;
+            ctx.setTransform(c, s, -s, c, x * d, y * d);
+            ctx.drawImage(src, -hw, -hh, w, h);
+          }
+        } else {
+          const a = spriteRotation(config.shape, t);
+          if (a !== 0) {
+            const c = Math.cos(a) * d, s = Math.sin(a) * d;
+            for (let i = 0; i < moverCount; i++) {
+              const x = prevX[i] + (posX[i] - prevX[i]) * alpha;
+              const y = prevY[i] + (posY[i] - prevY[i]) * alpha;
+              ctx.setTransform(c, s, -s, c, x * d, y * d);
+              ctx.drawImage(src, -hw, -hh, w, h);
+            }
+          } else {
+            ctx.setTransform(d, 0, 0, d, 0, 0);
+            for (let i = 0; i < moverCount; i++) {
+              const x = prevX[i] + (posX[i] - prevX[i]) * alpha;
+              const y = prevY[i] + (posY[i] - prevY[i]) * alpha;
+              ctx.drawImage(src, x - hw, y - hh, w, h);
+            }
+          }
+        }
+        ctx.setTransform(d, 0, 0, d, 0, 0);
+      }
+    </script>
+
+    <script id="worker-src" type="text/js-worker">
+      // Worker mode: the shared simulation (sim-src, prepended to this source) runs off the
+      // main thread and draws on an OffscreenCanvas
+      let canvas = null, ctx = null;
+      let dpr = 1, deviceDpr = 1;
+      let config = null;
+      let running = false;
+      let lastFrame = 0;
+      let frameScheduled = false;
+      let drawing = false;
+
+      const nextFrame = self.requestAnimationFrame
+        ? (cb) => self.requestAnimationFrame(cb)
+        : (cb) => setTimeout(() => cb(performance.now()), 1000 / 60);
+
+      /**
+       * Sizes the backing store for the canvas size and the current tier's pixel density.
+       */
+      function sizeCanvas() {
+        const q = QUALITY_TIERS[qualityTier];
+        dpr = q.density > 0 ? q.density : deviceDpr;
+        canvas.width = Math.round(canvasW * dpr);
+        canvas.height = Math.round(canvasH * dpr);
+      }
+
+      /**
+       * Switches to a quality tier; the page applies the panel blur when told about it.
+       */
+      function applyQualityTier(tier) {
+        qualityTier = tier;
+        sizeCanvas();
+        resetGovernor();
+        self.postMessage({ type: 'quality', tier: tier });
+        // Resizing cleared the canvas
+        requestFrame();
+      }
+
+      function showPerfStats(text) {
+        self.postMessage({ type: 'stats', text: text });
+      }
+
+      function render(alpha, t) {
+        ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+        ctx.fillStyle = config.bg_color;
+        ctx.fillRect(0, 0, canvasW, canvasH);
+        if (config.show_boundary) drawBoundary(ctx, dpr);
+        drawMovers(ctx, dpr, alpha, t);
+      }
+
+      function frame(now) {
+        frameScheduled = false;
+        // Honour the FPS cap by skipping display frames that come too soon (1 ms slack for vsync jitter)
+        if (config.fps_cap > 0 && now - lastFrame < 1000 / config.fps_cap - 1) {
+          requestFrame();
+          return;
+        }
+        const interval = now - lastFrame;
+        lastFrame = now;
+        const started = performance.now();
+        const alpha = running ? stepSimulation(interval, updateMovers) : 1;
+        render(alpha, now);
+        governQuality(interval, performance.now() - started);
+        // Keep animating while moving or tumbling; otherwise wait for the next message
+        drawing = running || config.shape === 'square' || config.shape === 'star';
+        if (drawing) requestFrame();
+      }
+
+      function requestFrame() {
+        if (frameScheduled) return;
+        frameScheduled = true;
+        // The first frame after a pause in drawing says nothing about frame times
+        if (!drawing) governor.skip = true;
+        nextFrame(frame);
+      }
+
+      function resize(w, h, ratio) {
+        canvasW = w; canvasH = h; deviceDpr = ratio;
+        sizeCanvas();
+        clampMovers();
+      }
+
+      self.onmessage = (e) => {
+        const msg = e.data;
+        if (msg.type === 'init') {
+          canvas = msg.canvas;
+          ctx = canvas.getContext('2d');
+          config = msg.config;
+          seedMovement(config.seed);
+          setFrameBudget(config.fps_cap);
+          resize(msg.width, msg.height, msg.dpr);
+          resetMovers(0, MAX_MOVERS);
+          setMoverCount(config.count);
+          for (let i = 0; i < moverCount; i++) pickNewMovement(i, simTime);
+          lastFrame = performance.now();
+        } else if (msg.type === 'config') {
+          config = msg.config;
+          if (msg.running && !running) lastFrame = performance.now();
+          running = msg.running;
+          setFrameBudget(config.fps_cap);
+          setMoverCount(config.count);
+        } else if (msg.type === 'resize') {
+          resize(msg.width, msg.height, msg.dpr);
+        } else if (msg.type === 'reset') {
+          resetMovers(0, moverCount);
+          for (let i = 0; i < moverCount; i++) pickNewMovement(i, simTime);
+          running = false;
+        }
+        requestFrame();
+      };
+    </script>
+
     <div class="controls" id="controls" role="region" aria-label="Controls">
       <h3>Animation Settings</h3>
       
@@ -196,10 +774,10 @@ html = r'''
       <div class="control-row">
         <div class="label-group">
           <label for="speedRange">Speed</label>
-          <span class="metric">px / frame (60fps)</span>
+          <span class="metric">px / second</span>
         </div>
-        <input id="speedRange" type="range" min="0.5" max="20" step="0.1" value="3" aria-label="Speed Slider">
-        <input id="speedNum" type="number" min="0.5" max="20" step="0.1" value="3" aria-label="Exact Speed">
+        <input id="speedRange" type="range" min="30" max="1200" step="10" value="180" aria-label="Speed Slider">
+        <input id="speedNum" type="number" min="30" max="1200" step="10" value="180" aria-label="Exact Speed">
       </div>
 
       <div class="control-row">
@@ -220,6 +798,24 @@ html = r'''
         <input id="pauseNum" type="number" min="0" max="2000" step="10" value="350" aria-label="Exact Pause">
       </div>
 
+      <div class="control-row">
+        <div class="label-group">
+          <label for="countRange">Objects</label>
+          <span class="metric">count</span>
+        </div>
+        <input id="countRange" type="range" min="1" max="10000" step="1" value="1" aria-label="Object Count Slider">
+        <input id="countNum" type="number" min="1" max="10000" step="1" value="1" aria-label="Exact Object Count">
+      </div>
+
+      <div class="control-row">
+        <div class="label-group">
+          <label for="fpsRange">FPS Cap</label>
+          <span class="metric">0 = display rate</span>
+        </div>
+        <input id="fpsRange" type="range" min="0" max="240" step="5" value="0" aria-label="FPS Cap Slider">
+        <input id="fpsNum" type="number" min="0" max="240" step="1" value="0" aria-label="Exact FPS Cap">
+      </div>
+
       <div class="control-row">
         <div class="label-group"><label for="dotColor">Object Color</label></div>
         <input type="color" id="dotColor" value="#00ffff" aria-label="Object Color" style="margin-left: auto;">
@@ -235,236 +831,480 @@ html = r'''
         <label for="showBoundary">Show boundaries</label>
       </div>
 
+      <div class="control-row">
+        <div class="label-group">
+          <label>Quality</label>
+          <span class="metric" id="qualityTier">Full</span>
+        </div>
+        <span class="perf-stats" id="perfStats">measuring…</span>
+      </div>
+
       <div class="footer-note">Tip: The menu and cursor auto-hide after 2 seconds. Move your mouse to reveal them.</div>
     </div>
 
     <script>
       let config = {
-        speed: 3,
+        speed: 180,
+        fps_cap: __FPS_CAP__,
         dot_size: 24,
         pause_ms: 350,
         color: '#00ffff',
         bg_color: '#2b2b2b',
         shape: 'circle',
-        show_boundary: true
+        show_boundary: true,
+        seed: __SEED__,
+        worker: __WORKER__,
+        telemetry: __TELEMETRY__,
+        engine: __ENGINE__,
+        count: 1
       };
 
-      let dot = { x: 0, y: 0, angle: 0, remaining: 0, pausedUntil: 0 };
+      // Movers, the simulation clock and quality tiers live in the shared sim-src block above
+      const UNCAPPED_FPS = 1000; // p5 then draws on every animation frame the display offers
+      let idleSince = 0;
+      let skipDelta = false;
       let running = false;
-      let margin = 15;
-      let canvasW = 800, canvasH = 600;
+      let idle = false;
+      let wakeTimer = null;
+      let worker = null;
 
       /**
        * Initializes the canvas, sets frame rate, and prepares the first movement.
        */
       function setup() {
+        // Python-driven trajectories are only followed on the main thread
+        if (config.worker && !config.engine && startWorker()) {
+          // The worker owns simulation and drawing; p5 stays out of the way on the main thread
+          noCanvas();
+          noLoop();
+          return;
+        }
         const holder = document.getElementById('sketch-holder');
         canvasW = holder.clientWidth || window.innerWidth;
         canvasH = holder.clientHeight || window.innerHeight;
         let cnv = createCanvas(canvasW, canvasH);
         cnv.parent('sketch-holder');
-        frameRate(60);
-        resetDotCenter();
-        pickNewMovement();
+        applyFpsCap();
+        seedMovement(config.seed);
+        resetMovers(0, MAX_MOVERS);
+        if (config.engine) resetWaypoints();
+        else for (let i = 0; i < moverCount; i++) pickNewMovement(i, simTime);
+      }
+
+      /**
+       * Moves simulation and rendering into a Web Worker drawing on an OffscreenCanvas.
+       * Returns false when the browser cannot do that, so the regular sketch runs instead.
+       */
+      function startWorker() {
+        if (typeof OffscreenCanvas === 'undefined' || !HTMLCanvasElement.prototype.transferControlToOffscreen) {
+          console.warn('OffscreenCanvas unavailable; running the sketch on the main thread.');
+          return false;
+        }
+        const holder = document.getElementById('sketch-holder');
+        const el = document.createElement('canvas');
+        el.style.width = '100%';
+        el.style.height = '100%';
+        el.style.display = 'block';
+        holder.appendChild(el);
+
+        // The worker runs the same simulation source as the page, followed by its own host code
+        const source = [document.getElementById('sim-src').textContent,
+                        document.getElementById('worker-src').textContent];
+        const url = URL.createObjectURL(new Blob(source, { type: 'text/javascript' }));
+        worker = new Worker(url);
+        URL.revokeObjectURL(url);
+        worker.onmessage = (e) => {
+          const msg = e.data;
+          if (msg.type === 'quality') {
+            qualityTier = msg.tier;
+            showQualityTier(msg.tier);
+          } else if (msg.type === 'stats') {
+            showPerfStats(msg.text);
+          }
+        };
+
+        const offscreen = el.transferControlToOffscreen();
+        worker.postMessage({
+          type: 'init', canvas: offscreen, config: config,
+          width: holder.clientWidth || window.innerWidth,
+          height: holder.clientHeight || window.innerHeight,
+          dpr: window.devicePixelRatio || 1
+        }, [offscreen]);
+        postWorkerConfig();
+        return true;
+      }
+
+      /**
+       * Sends the current settings and run state to the worker.
+       */
+      function postWorkerConfig() {
+        if (worker) worker.postMessage({ type: 'config', config: config, running: running });
       }
 
       /**
        * Dynamically resizes the canvas and recalculates bounds if the window changes size.
        */
       function windowResized() {
+        if (worker) {
+          const holder = document.getElementById('sketch-holder');
+          worker.postMessage({
+            type: 'resize',
+            width: holder.clientWidth || window.innerWidth,
+            height: holder.clientHeight || window.innerHeight,
+            dpr: window.devicePixelRatio || 1
+          });
+          return;
+        }
         const holder = document.getElementById('sketch-holder');
+        const oldW = canvasW, oldH = canvasH;
         canvasW = holder.clientWidth || window.innerWidth;
         canvasH = holder.clientHeight || window.innerHeight;
         resizeCanvas(canvasW, canvasH);
-        clampDotPosition();
+        clampMovers();
+        // Keep the session: Python picks up the new size with the next refill
+        if (config.engine) fitWaypoints(oldW, oldH);
+        wake();
       }
 
       /**
-       * Centers the shape on the canvas and clears its movement state.
+       * Shapes whose appearance changes every frame even when the dot is not moving.
        */
-      function resetDotCenter() {
-        dot.x = canvasW / 2;
-        dot.y = canvasH / 2;
-        dot.remaining = 0;
-        dot.pausedUntil = 0;
+      function isAnimatedShape() {
+        return config.shape === 'square' || config.shape === 'star';
       }
 
       /**
-       * Assigns a random trajectory angle and travel distance based on screen proportions.
+       * Stops the render loop while the scene is static; wakes itself when the earliest pause ends.
        */
-      function pickNewMovement() {
-        dot.angle = random(0, TWO_PI);
-        const diag = sqrt(sq(canvasW) + sq(canvasH));
-        const dynMin = min(100, diag * 0.1);
-        const dynMax = min(600, diag * 0.6);
-        dot.remaining = random(dynMin, dynMax);
-        dot.pausedUntil = millis() + config.pause_ms;
+      function updateIdle() {
+        if (worker || isAnimatedShape()) return;
+        let wakeInMs = 0;
+        if (running) {
+          wakeInMs = nextWakeAt - simTime;
+          if (wakeInMs <= 0) return;
+        }
+        idle = true;
+        idleSince = performance.now();
+        noLoop();
+        if (wakeInMs > 0) wakeTimer = setTimeout(wake, wakeInMs);
       }
 
       /**
-       * Enforces boundaries by snapping the shape back inside the margin limits dynamically based on size.
+       * Resumes the render loop after any input or state change; it idles again on its own.
        */
-      function clampDotPosition() {
-        const offset = margin + (config.dot_size / 2);
-        const maxX = canvasW / 2 - offset;
-        const maxY = canvasH / 2 - offset;
-        const centerX = canvasW / 2, centerY = canvasH / 2;
-        
-        let relX = dot.x - centerX;
-        let relY = dot.y - centerY;
-        
-        if (relX > maxX) relX = maxX;
-        if (relX < -maxX) relX = -maxX;
-        if (relY > maxY) relY = maxY;
-        if (relY < -maxY) relY = -maxY;
-        
-        dot.x = centerX + relX;
-        dot.y = centerY + relY;
+      function wake() {
+        // The worker runs its own loop; the main thread's must stay stopped
+        if (worker) return;
+        if (wakeTimer) { clearTimeout(wakeTimer); wakeTimer = null; }
+        if (idle) {
+          idle = false;
+          // Only pause clocks ran while idle; credit that time without simulating it step by step
+          if (running) simTime += performance.now() - idleSince;
+          skipDelta = true;
+          governor.skip = true;
+          telemetryState.skip = true;
+          loop();
+        }
       }
 
       /**
-       * Renders the faint rectangular bounding box limit on the canvas.
+       * Changes the number of live movers; new ones also start with empty turn-point buffers.
        */
-      function drawBoundary() {
-        if (!config.show_boundary) return;
-        push();
-        stroke(255, 120);
-        strokeWeight(1.5);
-        noFill();
-        const offset = margin + (config.dot_size / 2);
-        const maxX = canvasW / 2 - offset;
-        const maxY = canvasH / 2 - offset;
-        rectMode(CENTER);
-        rect(canvasW / 2, canvasH / 2, maxX * 2, maxY * 2, 6);
-        pop();
+      function changeMoverCount(n) {
+        const from = moverCount;
+        setMoverCount(n);
+        if (moverCount > from) waypointLen.fill(0, from, moverCount);
       }
 
       /**
-       * Helper function to draw a multi-pointed star.
+       * Applies config.fps_cap (0 = uncapped) to the draw loop and the governor's frame budget.
        */
-      function drawStar(x, y, radius1, radius2, npoints) {
-        let angle = TWO_PI / npoints;
-        let halfAngle = angle / 2.0;
-        beginShape();
-        for (let a = -PI / 2; a < TWO_PI - PI / 2; a += angle) {
-          let sx = x + cos(a) * radius2;
-          let sy = y + sin(a) * radius2;
-          vertex(sx, sy);
-          sx = x + cos(a + halfAngle) * radius1;
-          sy = y + sin(a + halfAngle) * radius1;
-          vertex(sx, sy);
-        }
-        endShape(CLOSE);
+      function applyFpsCap() {
+        setFrameBudget(config.fps_cap);
+        if (!worker) frameRate(config.fps_cap > 0 ? config.fps_cap : UNCAPPED_FPS);
       }
 
       /**
-       * Helper function to draw a mathematically perfect heart using parametric equations.
+       * Switches to a quality tier: canvas pixel density, sprite detail and panel blur.
        */
-      function drawHeart(x, y, size) {
-        push();
-        translate(x, y - size * 0.15);
-        beginShape();
-        for (let a = 0; a < TWO_PI; a += 0.05) {
-          let hx = 16 * pow(sin(a), 3);
-          let hy = -(13 * cos(a) - 5 * cos(2 * a) - 2 * cos(3 * a) - cos(4 * a));
-          vertex(hx * size * 0.03, hy * size * 0.03);
-        }
-        endShape(CLOSE);
-        pop();
+      function applyQualityTier(tier) {
+        qualityTier = tier;
+        const q = QUALITY_TIERS[tier];
+        pixelDensity(q.density > 0 ? q.density : displayDensity());
+        showQualityTier(tier);
+        resetGovernor();
       }
 
       /**
-       * Draws the selected geometry onto the canvas, applying dynamic rotations and shadow effects.
+       * Reflects a quality tier in the panel, whichever thread chose it.
        */
-      function drawDot() {
-        push();
-        translate(dot.x, dot.y);
-        
-        // Orient specific shapes (Arrow) to face the direction of travel
-        if (config.shape === 'triangle') {
-          rotate(dot.angle + PI / 2);
-        }
+      function showQualityTier(tier) {
+        const q = QUALITY_TIERS[tier];
+        document.getElementById('controls').classList.toggle('no-blur', !q.panelBlur);
+        document.getElementById('qualityTier').textContent = q.name;
+      }
 
-        noStroke();
-        fill(config.color);
-        const size = config.dot_size;
-
-        if (config.shape === 'circle') {
-          ellipse(0, 0, size, size);
-        } else if (config.shape === 'glow') {
-          drawingContext.shadowBlur = size * 1.5;
-          drawingContext.shadowColor = config.color;
-          ellipse(0, 0, size, size);
-        } else if (config.shape === 'square') {
-          rotate(millis() / 1500.0); // Continuous tumbling
-          rectMode(CENTER);
-          rect(0, 0, size, size, size * 0.25); 
-        } else if (config.shape === 'triangle') {
-          triangle(0, -size / 1.5, -size / 2, size / 2, size / 2, size / 2);
-        } else if (config.shape === 'star') {
-          rotate(millis() / 1000.0); // Continuous tumbling
-          drawStar(0, 0, size / 2.5, size, 5);
-        } else if (config.shape === 'heart') {
-          drawHeart(0, 0, size);
-        } else if (config.shape === 'ring') {
-          noFill();
-          stroke(config.color);
-          strokeWeight(size * 0.2);
-          ellipse(0, 0, size, size);
-        }
-        
-        pop();
+      function showPerfStats(text) {
+        document.getElementById('perfStats').textContent = text;
       }
 
       /**
        * Main p5 render loop executing every frame to update positions and draw objects.
        */
       function draw() {
+        // p5 still calls draw() once after setup() even though it ran noLoop()
+        if (worker) return;
+        const started = performance.now();
+        const interval = deltaTime;
+        renderFrame();
+        governQuality(interval, performance.now() - started);
+        recordTelemetry(interval);
+        updateIdle();
+      }
+
+      // Frame-time histogram batched and sent to Python once per interval, never per frame
+      const telemetryState = {
+        session: Math.random().toString(36).slice(2, 10),
+        hist: config.telemetry ? new Uint32Array(config.telemetry.edges.length + 1) : null,
+        frames: 0, dropped: 0, skip: true
+      };
+
+      /**
+       * Counts one frame interval into the current telemetry batch.
+       */
+      function recordTelemetry(intervalMs) {
+        const t = telemetryState;
+        if (!t.hist) return;
+        if (t.skip) { t.skip = false; return; }
+        const edges = config.telemetry.edges;
+        let b = 0;
+        while (b < edges.length && intervalMs >= edges[b]) b++;
+        t.hist[b]++;
+        t.frames++;
+        if (intervalMs > frameBudgetMs * 1.5) t.dropped++;
+      }
+
+      /**
+       * Posts the current batch (if any frames were drawn) and starts a new one.
+       */
+      function flushTelemetry() {
+        const t = telemetryState;
+        if (t.frames === 0) return;
+        const mem = performance.memory;
+        const body = JSON.stringify({
+          session: t.session,
+          interval_ms: config.telemetry.interval_ms,
+          frames: t.frames,
+          dropped: t.dropped,
+          hist: Array.from(t.hist),
+          heap_used: mem ? mem.usedJSHeapSize : null,
+          heap_limit: mem ? mem.jsHeapSizeLimit : null,
+          quality: QUALITY_TIERS[qualityTier].name,
+          movers: moverCount,
+          shape: config.shape
+        });
+        t.hist.fill(0);
+        t.frames = 0;
+        t.dropped = 0;
+        // text/plain keeps this a simple request, so the sandboxed iframe needs no CORS preflight
+        fetch(config.telemetry.url, { method: 'POST', mode: 'no-cors', keepalive: true,
+                                      headers: { 'Content-Type': 'text/plain' }, body: body })
+          .catch(() => {});
+      }
+
+      if (config.telemetry) setInterval(flushTelemetry, config.telemetry.interval_ms);
+
+      /**
+       * Advances all movers by one step and draws the scene.
+       */
+      function renderFrame() {
+        if (!window.__rdFirstFrame) {
+          // Wall-clock time of the first frame, read by measure_cold_start.py
+          window.__rdFirstFrame = performance.timeOrigin + performance.now();
+          try { window.parent.__rdFirstFrame = window.__rdFirstFrame; } catch (e) {}
+        }
         background(config.bg_color);
         canvasW = windowWidth;
         canvasH = windowHeight;
 
-        drawBoundary();
+        const ctx = drawingContext;
+        const d = pixelDensity();
+        if (config.show_boundary) drawBoundary(ctx, d);
 
-        if (millis() < dot.pausedUntil || !running) {
-          drawDot();
-          return;
-        }
+        const alpha = running ? advanceSimulation() : 1;
+        drawMovers(ctx, d, alpha, millis());
+      }
+
+      /**
+       * Runs as many fixed simulation steps as the elapsed deltaTime covers and
+       * returns how far into the next step the display currently is (0..1).
+       */
+      function advanceSimulation() {
+        const elapsed = skipDelta ? 0 : deltaTime;
+        skipDelta = false;
+        return stepSimulation(elapsed, config.engine ? followWaypoints : updateMovers);
+      }
+
+      // Turn points generated by Python (?engine=python), one ring buffer per mover.
+      // Coordinates are relative to the canvas centre with y pointing up, as in MotionEngine.
+      const WAYPOINT_CAP = 32;
+      const WAYPOINT_LOW = 8;
+      const WAYPOINT_RETRY_MS = 1000;
+      const waypointX = new Float32Array(MAX_MOVERS * WAYPOINT_CAP);
+      const waypointY = new Float32Array(MAX_MOVERS * WAYPOINT_CAP);
+      const waypointHead = new Uint16Array(MAX_MOVERS);
+      const waypointLen = new Uint16Array(MAX_MOVERS);
+      const targetX = new Float32Array(MAX_MOVERS);
+      const targetY = new Float32Array(MAX_MOVERS);
+      const waypoints = { session: '', generation: 0, inFlight: false, retryAt: 0 };
+
+      /**
+       * Drops every buffered turn point and starts a fresh trajectory session in Python.
+       */
+      function resetWaypoints() {
+        waypointLen.fill(0);
+        waypointHead.fill(0);
+        waypoints.session = Math.random().toString(36).slice(2, 10);
+        // Any refill still in flight belongs to the old session
+        waypoints.generation++;
+        waypoints.retryAt = 0;
+      }
+
+      /**
+       * Asks Python for enough turn points to top every mover's buffer back up.
+       * Only one request is in flight at a time; the reply is appended when it lands.
+       */
+      function requestWaypoints() {
+        if (waypoints.inFlight || performance.now() < waypoints.retryAt) return;
+        waypoints.inFlight = true;
+        const generation = waypoints.generation;
+        const need = new Uint16Array(moverCount);
+        for (let i = 0; i < moverCount; i++) need[i] = WAYPOINT_CAP - waypointLen[i];
+        const params = new URLSearchParams({
+          session: waypoints.session, width: canvasW, height: canvasH, size: config.dot_size
+        });
+        if (config.seed !== null) params.set('seed', config.seed);
+        // text/plain keeps this a simple request, so the sandboxed iframe needs no CORS preflight
+        fetch(config.engine.url + '?' + params, { method: 'POST', headers: { 'Content-Type': 'text/plain' }, body: need })
+          .then(r => {
+            if (!r.ok) throw new Error('HTTP ' + r.status);
+            return r.arrayBuffer();
+          })
+          .then(buf => {
+            if (generation === waypoints.generation) appendWaypoints(need, new Float32Array(buf));
+          })
+          .catch(err => {
+            console.warn('Trajectory refill failed:', err.message);
+            waypoints.retryAt = performance.now() + WAYPOINT_RETRY_MS;
+          })
+          .finally(() => {
+            waypoints.inFlight = false;
+            wake();
+          });
+      }
 
-        if (dot.remaining <= 0) { 
-          pickNewMovement(); 
-          drawDot(); 
-          return; 
+      /**
+       * Clamps buffered turn points and each segment in progress to the current bounds,
+       * so a resize keeps every mover on its trajectory instead of starting a new one.
+       */
+      function fitWaypoints(oldW, oldH) {
+        const offset = edgeOffset();
+        const maxX = canvasW / 2 - offset, maxY = canvasH / 2 - offset;
+        for (let i = 0; i < moverCount; i++) {
+          for (let j = 0; j < waypointLen[i]; j++) {
+            const slot = i * WAYPOINT_CAP + (waypointHead[i] + j) % WAYPOINT_CAP;
+            waypointX[slot] = constrain(waypointX[slot], -maxX, maxX);
+            waypointY[slot] = constrain(waypointY[slot], -maxY, maxY);
+          }
+          if (remaining[i] > 0) {
+            // Targets are stored in canvas pixels; re-anchor them on the new centre
+            targetX[i] = canvasW / 2 + constrain(targetX[i] - oldW / 2, -maxX, maxX);
+            targetY[i] = canvasH / 2 + constrain(targetY[i] - oldH / 2, -maxY, maxY);
+            const dx = targetX[i] - posX[i], dy = targetY[i] - posY[i];
+            remaining[i] = Math.sqrt(dx * dx + dy * dy);
+            heading[i] = Math.atan2(dy, dx);
+          }
         }
+      }
 
-        let step = min(config.speed, dot.remaining);
-        dot.x += cos(dot.angle) * step;
-        dot.y += sin(dot.angle) * step;
-        dot.remaining -= step;
+      /**
+       * Appends a reply of packed (x, y) pairs, need[i] of them for mover i in mover order.
+       * A reply generated before a resize is clamped to the current bounds.
+       */
+      function appendWaypoints(need, points) {
+        const offset = edgeOffset();
+        const maxX = canvasW / 2 - offset, maxY = canvasH / 2 - offset;
+        let k = 0;
+        for (let i = 0; i < need.length; i++) {
+          for (let j = 0; j < need[i] && k + 1 < points.length; j++, k += 2) {
+            const slot = i * WAYPOINT_CAP + (waypointHead[i] + waypointLen[i]) % WAYPOINT_CAP;
+            waypointX[slot] = constrain(points[k], -maxX, maxX);
+            waypointY[slot] = constrain(points[k + 1], -maxY, maxY);
+            waypointLen[i]++;
+          }
+        }
+      }
 
-        const offset = margin + (config.dot_size / 2);
-        const maxX = canvasW / 2 - offset;
-        const maxY = canvasH / 2 - offset;
+      /**
+       * Points mover i at its next buffered turn point and starts the turn pause.
+       * Returns false when the buffer is empty.
+       */
+      function takeWaypoint(i, now) {
         const centerX = canvasW / 2, centerY = canvasH / 2;
-        
-        let relX = dot.x - centerX;
-        let relY = dot.y - centerY;
-        let hitEdge = false;
+        while (waypointLen[i] > 0) {
+          const slot = i * WAYPOINT_CAP + waypointHead[i];
+          waypointHead[i] = (waypointHead[i] + 1) % WAYPOINT_CAP;
+          waypointLen[i]--;
+          const dx = centerX + waypointX[slot] - posX[i];
+          const dy = centerY - waypointY[slot] - posY[i];
+          const dist = Math.sqrt(dx * dx + dy * dy);
+          // A session's first point is where the mover already stands
+          if (dist < 0.5) continue;
+          targetX[i] = centerX + waypointX[slot];
+          targetY[i] = centerY - waypointY[slot];
+          heading[i] = Math.atan2(dy, dx);
+          remaining[i] = dist;
+          pausedUntil[i] = now + config.pause_ms;
+          return true;
+        }
+        return false;
+      }
 
-        if (relX >= maxX) { relX = maxX; hitEdge = true; }
-        if (relX <= -maxX) { relX = -maxX; hitEdge = true; }
-        if (relY >= maxY) { relY = maxY; hitEdge = true; }
-        if (relY <= -maxY) { relY = -maxY; hitEdge = true; }
+      /**
+       * Moves every mover in a straight line towards its current turn point. All randomness
+       * and edge handling happened in Python, so this only interpolates and pauses.
+       */
+      function followWaypoints(now, dt) {
+        const speed = config.speed * dt;
+        let wakeAt = Infinity;
+        let low = false;
 
-        dot.x = centerX + relX;
-        dot.y = centerY + relY;
+        for (let i = 0; i < moverCount; i++) {
+          if (waypointLen[i] < WAYPOINT_LOW) low = true;
+          if (now < pausedUntil[i]) {
+            if (pausedUntil[i] < wakeAt) wakeAt = pausedUntil[i];
+            continue;
+          }
+          if (remaining[i] <= 0) {
+            // A starved mover waits in place; keep the loop awake until the refill lands
+            if (!takeWaypoint(i, now)) wakeAt = now;
+            else if (pausedUntil[i] < wakeAt) wakeAt = pausedUntil[i];
+            continue;
+          }
 
-        if (hitEdge) {
-          dot.remaining = 0;
-          dot.pausedUntil = millis() + config.pause_ms;
+          const step = remaining[i] < speed ? remaining[i] : speed;
+          remaining[i] -= step;
+          if (remaining[i] <= 0) {
+            posX[i] = targetX[i];
+            posY[i] = targetY[i];
+          } else {
+            posX[i] += Math.cos(heading[i]) * step;
+            posY[i] += Math.sin(heading[i]) * step;
+          }
+          wakeAt = now;
         }
-
-        drawDot();
+        nextWakeAt = wakeAt;
+        if (low) requestWaypoints();
       }
 
       // UI Control Bindings
@@ -483,6 +1323,10 @@ html = r'''
         const sizeNum = document.getElementById('sizeNum');
         const pauseRange = document.getElementById('pauseRange');
         const pauseNum = document.getElementById('pauseNum');
+        const countRange = document.getElementById('countRange');
+        const countNum = document.getElementById('countNum');
+        const fpsRange = document.getElementById('fpsRange');
+        const fpsNum = document.getElementById('fpsNum');
         
         const dotColorInput = document.getElementById('dotColor');
         const bgColorInput = document.getElementById('bgColor');
@@ -491,7 +1335,17 @@ html = r'''
 
         startBtn.onclick = () => { running = true; };
         stopBtn.onclick = () => { running = false; };
-        resetBtn.onclick = () => { resetDotCenter(); pickNewMovement(); running = false; };
+        resetBtn.onclick = () => {
+          if (worker) {
+            running = false;
+            worker.postMessage({ type: 'reset' });
+            return;
+          }
+          resetMovers(0, moverCount);
+          if (config.engine) resetWaypoints();
+          else for (let i = 0; i < moverCount; i++) pickNewMovement(i, simTime);
+          running = false;
+        };
 
         // Handle native browser Fullscreen toggling
         fullscreenBtn.onclick = () => {
@@ -553,6 +1407,14 @@ html = r'''
         syncInputs(speedRange, speedNum, 'speed', true);
         syncInputs(sizeRange, sizeNum, 'dot_size', false);
         syncInputs(pauseRange, pauseNum, 'pause_ms', false);
+        syncInputs(countRange, countNum, 'count', false);
+        countRange.addEventListener('input', () => changeMoverCount(config.count));
+        countNum.addEventListener('input', () => changeMoverCount(config.count));
+        // ?fps=N may have set the cap before the panel existed
+        fpsRange.value = fpsNum.value = config.fps_cap;
+        syncInputs(fpsRange, fpsNum, 'fps_cap', false);
+        fpsRange.addEventListener('input', applyFpsCap);
+        fpsNum.addEventListener('input', applyFpsCap);
         
         dotColorInput.oninput = (e) => { config.color = e.target.value; };
         bgColorInput.oninput = (e) => { 
@@ -561,6 +1423,11 @@ html = r'''
         };
         showBoundary.onchange = (e) => { config.show_boundary = e.target.checked; };
 
+        // Any control interaction may change the scene, so leave idle mode after the handlers above run
+        ['input', 'change', 'click'].forEach(type => controlsEl.addEventListener(type, wake));
+        // In worker mode the panel only reports changes; the worker applies them off the main thread
+        ['input', 'change', 'click'].forEach(type => controlsEl.addEventListener(type, postWorkerConfig));
+
         // Auto-Hide Logic
         let hideTimer = null;
         const hideDelay = 2000;
@@ -590,5 +1457,29 @@ html = r'''
 </html>
 '''
 
+# Optional ?seed=N query parameter makes the sketch's random walk reproducible
+seed_param = st.query_params.get("seed")
+html = html.replace("__SEED__", str(int(seed_param)) if seed_param and seed_param.lstrip("-").isdigit() else "null")
+
+# Optional ?fps=N caps the frame rate (0 or absent draws at the display's rate)
+fps_param = st.query_params.get("fps")
+html = html.replace("__FPS_CAP__", str(min(int(fps_param), 240)) if fps_param and fps_param.isdigit() else "0")
+
+# ?worker=1 moves the simulation and drawing into a Web Worker with an OffscreenCanvas
+html = html.replace("__WORKER__", "true" if st.query_params.get("worker") in ("1", "true") else "false")
+# ?engine=python has Python generate the trajectories and the sketch only render them
+use_python_engine = st.query_params.get("engine") == "python"
+if use_python_engine and st.context.headers.get("Origin"):
+    # The browser's Origin for this session's websocket is the page the sketch's fetches come from.
+    local_api_urls()["origins"].add(st.context.headers["Origin"])
+html = html.replace("__ENGINE__", json.dumps(
+    {"url": local_api_urls()["trajectory"]} if use_python_engine else None))
+html = html.replace("__TELEMETRY__", json.dumps({
+    "url": local_api_urls()["telemetry"],
+    "edges": FRAME_BUCKETS_MS,
+    "interval_ms": REPORT_INTERVAL_MS,
+}))
+html = html.replace("__P5_SCRIPT__", p5_script)
+
 # Embed the HTML within Streamlit
 st.components.v1.html(html, height=900, scrolling=False)
\ No newline at end of file
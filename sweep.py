@@ -0,0 +1,197 @@
+"""
+Parallel parameter sweep over the motion settings.
+Every combination of the given speeds, pauses, distances, edge margins,
+redirect steps, screen sizes and seeds is simulated headless on a process
+pool, and each run reports how evenly it covers the screen, how much time
+it spends near the edges and how often it redirects, e.g.:
+
+    python sweep.py --speed 120 180 240 --pause 0.2 0.35 --screen 1920x1080 3840x2160 \\
+        --seeds 4 --out sweep.parquet
+
+Finished runs are appended to a CSV journal as they complete, so an
+interrupted sweep picks up where it stopped when started again with the
+same --out. Each row records the --seconds and --sample-rate it ran with, and
+only rows with the current values count as done. Parquet output is written from
+the journal once every run is done.
+"""
+
+import argparse
+import csv
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine import MotionEngine, playfield_bounds
+from occupancy import OccupancyGrid
+
+PARAMS = ("width", "height", "speed", "pause", "min_distance", "max_distance",
+          "edge_margin", "redirect_step", "count", "seed")
+SETTINGS = ("seconds", "sample_rate")
+METRICS = ("covered", "cv", "edge_fraction", "redirects_per_min", "segments_per_min")
+FIELDS = PARAMS + SETTINGS + METRICS
+
+SAMPLE_RATE = 30.0
+EDGE_BAND = 20.0
+DOT_SIZE = 24
+
+
+def run_one(params, seconds, sample_rate=SAMPLE_RATE, edge_band=EDGE_BAND, size=DOT_SIZE):
+    """Simulate one parameter combination and return its row (params, settings and metrics)."""
+    p = dict(params)
+    engine = MotionEngine(count=p["count"], speed=p["speed"], pause=p["pause"],
+                          min_distance=p["min_distance"], max_distance=p["max_distance"],
+                          redirect_step=p["redirect_step"], seed=p["seed"])
+    engine.set_bounds(*playfield_bounds(p["width"], p["height"], size, p["edge_margin"]))
+    grid = OccupancyGrid(engine.max_x, engine.max_y)
+
+    interval = 1.0 / sample_rate
+    samples = int(round(seconds * sample_rate))
+    near_edge = 0
+    segments = 0
+    redirects = 0
+    for _ in range(samples):
+        grid.add(engine.x, engine.y)
+        near_edge += int(np.count_nonzero((np.abs(engine.x) > engine.max_x - edge_band)
+                                          | (np.abs(engine.y) > engine.max_y - edge_band)))
+        engine.segment_started[:] = False
+        engine.advance(interval)
+        segments += int(np.count_nonzero(engine.segment_started))
+        redirects += int(np.count_nonzero(engine.segment_started & engine.redirecting))
+
+    s = grid.summary()
+    minutes = seconds / 60.0 * p["count"]
+    p.update(
+        seconds=seconds,
+        sample_rate=sample_rate,
+        covered=s["covered"],
+        cv=s["cv"],
+        edge_fraction=near_edge / max(samples * p["count"], 1),
+        redirects_per_min=redirects / minutes if minutes else 0.0,
+        segments_per_min=segments / minutes if minutes else 0.0,
+    )
+    return p
+
+
+def _run_key(row):
+    # Parameters are compared as text so rows read back from the journal match fresh ones.
+    return tuple(str(float(row[k])) for k in PARAMS + SETTINGS)
+
+
+def build_grid(args):
+    """Every parameter combination as a list of dicts, in a stable order."""
+    screens = [tuple(int(v) for v in s.lower().split("x")) for s in args.screen]
+    combos = itertools.product(screens, args.speed, args.pause, args.min_distance, args.max_distance,
+                               args.edge_margin, args.redirect_step, args.count, range(args.seeds))
+    runs = []
+    for (w, h), speed, pause, dmin, dmax, margin, redirect, count, seed in combos:
+        if dmin > dmax:
+            continue
+        runs.append(dict(zip(PARAMS, (w, h, speed, pause, dmin, dmax, margin, redirect, count,
+                                      args.seed_base + seed))))
+    return runs
+
+
+def journal_path(out):
+    return out if out.endswith(".csv") else out + ".partial.csv"
+
+
+def read_done(path):
+    """Keys of the runs already in the journal.
+
+    A row cut short by an interruption is dropped by rewriting the journal, as
+    is every row of a journal written with other columns.
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        header = reader.fieldnames
+    complete = [r for r in rows if all(r.get(k) not in (None, "") for k in FIELDS)]
+    if len(complete) != len(rows) or header != list(FIELDS):
+        tmp = path + ".tmp"
+        with open(tmp, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(complete)
+        os.replace(tmp, path)
+    return {_run_key(r) for r in complete}
+
+
+def sweep(runs, out, seconds, workers=None, sample_rate=SAMPLE_RATE):
+    """Run everything not already in the journal; returns the number of runs executed."""
+    path = journal_path(out)
+    done = read_done(path)
+    settings = dict(seconds=seconds, sample_rate=sample_rate)
+    todo = [r for r in runs if _run_key(dict(r, **settings)) not in done]
+    workers = workers or os.cpu_count() or 1
+    window = workers * 4
+
+    new_file = not os.path.exists(path)
+    with open(path, "a", newline="") as f, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        pending = deque()
+        finished = 0
+
+        def drain_one():
+            nonlocal finished
+            writer.writerow(pending.popleft().result())
+            # Flush every row so an interrupted sweep loses at most the runs in flight.
+            f.flush()
+            finished += 1
+            print(f"\r{len(runs) - len(todo) + finished}/{len(runs)} runs", end="", flush=True)
+
+        for run in todo:
+            pending.append(pool.submit(run_one, run, seconds, sample_rate))
+            if len(pending) >= window:
+                drain_one()
+        while pending:
+            drain_one()
+    if todo:
+        print()
+
+    if not out.endswith(".csv"):
+        write_parquet(path, out)
+    return len(todo)
+
+
+def write_parquet(journal, out):
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    pq.write_table(pacsv.read_csv(journal), out)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep motion settings headless and tabulate the results")
+    parser.add_argument("--screen", nargs="+", default=["1920x1080"], metavar="WxH")
+    parser.add_argument("--speed", nargs="+", type=float, default=[180.0], help="pixels per second")
+    parser.add_argument("--pause", nargs="+", type=float, default=[0.35], help="seconds")
+    parser.add_argument("--min-distance", nargs="+", type=float, default=[100.0])
+    parser.add_argument("--max-distance", nargs="+", type=float, default=[600.0])
+    parser.add_argument("--edge-margin", nargs="+", type=float, default=[15.0])
+    parser.add_argument("--redirect-step", nargs="+", type=float, default=[150.0])
+    parser.add_argument("--count", nargs="+", type=int, default=[1], help="movers per run")
+    parser.add_argument("--seeds", type=int, default=3, help="repetitions of each combination")
+    parser.add_argument("--seed-base", type=int, default=0)
+    parser.add_argument("--seconds", type=float, default=600.0, help="simulated time per run")
+    parser.add_argument("--sample-rate", type=float, default=SAMPLE_RATE)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", required=True, metavar="PATH", help="results table (.csv or .parquet)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    runs = build_grid(args)
+    ran = sweep(runs, args.out, args.seconds, workers=args.workers, sample_rate=args.sample_rate)
+    print(f"{ran} runs executed, {len(runs) - ran} already done; results in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Performance telemetry from the p5 sketch back to Python.
+The sketch batches a frame-time histogram, dropped-frame count and JS heap
+usage and POSTs one small JSON message per interval to the local_api
+endpoint running next to the Streamlit server. Batches are kept in a bounded
+ring buffer, aggregated, and appended to a rotating JSON-lines log.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+# Upper edges of the frame-time histogram buckets in ms; the last bucket is open-ended.
+FRAME_BUCKETS_MS = (4.0, 8.0, 12.0, 16.7, 20.0, 25.0, 33.4, 50.0, 100.0)
+REPORT_INTERVAL_MS = 5000
+RING_CAPACITY = 720  # one hour of 5 s batches
+MAX_BODY_BYTES = 16 * 1024
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 5
+
+if getattr(sys, 'frozen', False):
+    LOG_DIR = os.path.dirname(sys.executable)
+else:
+    LOG_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_PATH = os.path.join(LOG_DIR, "telemetry.log")
+
+
+class TelemetryStore:
+    def __init__(self, capacity=RING_CAPACITY, log_path=LOG_PATH,
+                 max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        self.batches = deque(maxlen=capacity)
+        self.frames = 0
+        self.dropped = 0
+        self.histogram = [0] * (len(FRAME_BUCKETS_MS) + 1)
+        self.heap_used = None
+        self._lock = threading.Lock()
+        self._log = None
+        if log_path:
+            self._log = logging.getLogger(f"telemetry.{id(self)}")
+            self._log.propagate = False
+            self._log.setLevel(logging.INFO)
+            handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._log.addHandler(handler)
+
+    def add(self, batch):
+        """Validate one batch from the sketch and fold it into the aggregates."""
+        hist = batch.get("hist")
+        if not isinstance(hist, list) or len(hist) != len(self.histogram):
+            raise ValueError("histogram does not match FRAME_BUCKETS_MS")
+        hist = [int(c) for c in hist]
+        record = {
+            "received": time.time(),
+            "session": str(batch.get("session", ""))[:64],
+            "interval_ms": float(batch.get("interval_ms", 0)),
+            "frames": int(batch.get("frames", sum(hist))),
+            "dropped": int(batch.get("dropped", 0)),
+            "hist": hist,
+            "heap_used": batch.get("heap_used"),
+            "heap_limit": batch.get("heap_limit"),
+            "quality": batch.get("quality"),
+            "movers": batch.get("movers"),
+            "shape": batch.get("shape"),
+        }
+        with self._lock:
+            self.batches.append(record)
+            self.frames += record["frames"]
+            self.dropped += record["dropped"]
+            for i, c in enumerate(hist):
+                self.histogram[i] += c
+            if record["heap_used"] is not None:
+                self.heap_used = record["heap_used"]
+        if self._log is not None:
+            self._log.info(json.dumps(record, separators=(",", ":")))
+        return record
+
+    def summary(self):
+        with self._lock:
+            return {
+                "batches": len(self.batches),
+                "frames": self.frames,
+                "dropped": self.dropped,
+                "dropped_ratio": self.dropped / self.frames if self.frames else 0.0,
+                "histogram": dict(zip([f"<{e}" for e in FRAME_BUCKETS_MS] + [f">={FRAME_BUCKETS_MS[-1]}"],
+                                      self.histogram)),
+                "heap_used": self.heap_used,
+            }
+
+
+def telemetry_route(store):
+    """Build the local_api route that receives POSTed batches into ``store``."""
+    def handle(query, body):
+        if not body or len(body) > MAX_BODY_BYTES:
+            raise ValueError("empty or oversized telemetry batch")
+        store.add(json.loads(body))
+        return 204, "", b""
+    return handle
@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+import pytest
+
+from engine import MAX_DISTANCE, MIN_DISTANCE, REDIRECT_STEP, MotionEngine
+
+DT = 1.0 / 120.0
+
+
+def seeded(count, seed, **kwargs):
+    engine = MotionEngine(count=count, **kwargs)
+    engine.rng = np.random.default_rng(seed)
+    return engine
+
+
+def reference_walk(seed, steps, dt, max_x, max_y, speed, pause):
+    """The original per-turtle loop from main.py, one mover, scalar arithmetic."""
+    rng = np.random.default_rng(seed)
+    t = 0.0
+    x = y = 0.0
+
+    def pick(now):
+        angle = rng.uniform(0.0, 360.0)
+        return angle, rng.uniform(MIN_DISTANCE, MAX_DISTANCE), now + pause
+
+    angle, remaining, paused_until = pick(t)
+    path = []
+    for _ in range(steps):
+        t += dt
+        if t >= paused_until:
+            if remaining <= 0:
+                angle, remaining, paused_until = pick(t)
+            else:
+                step = min(speed * dt, remaining)
+                x += math.cos(math.radians(angle)) * step
+                y += math.sin(math.radians(angle)) * step
+                remaining -= step
+                if abs(x) > max_x or abs(y) > max_y:
+                    if abs(x) < 1 and abs(y) < 1:
+                        angle, remaining, paused_until = pick(t)
+                    else:
+                        angle = math.degrees(math.atan2(-y, -x)) % 360.0
+                        remaining, paused_until = REDIRECT_STEP, t + pause
+        path.append((x, y))
+    return np.array(path)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 7])
+def test_step_matches_original_loop(seed):
+    engine = seeded(1, seed, speed=300.0, pause=0.1)
+    engine.set_bounds(200.0, 120.0)
+    engine.start_random(engine.needs_movement())
+    path = []
+    for _ in range(3000):
+        engine.step(DT)
+        path.append((engine.x[0], engine.y[0]))
+    expected = reference_walk(seed, 3000, DT, 200.0, 120.0, 300.0, 0.1)
+    np.testing.assert_allclose(np.array(path), expected, atol=1e-6)
+
+
+def test_step_redirects_back_inside():
+    engine = seeded(500, 3, speed=600.0, pause=0.0)
+    engine.set_bounds(150.0, 80.0)
+    engine.start_random(engine.needs_movement())
+    for _ in range(2000):
+        engine.step(DT)
+        # A mover may overshoot by at most one step before it is turned around.
+        assert np.all(np.abs(engine.x) <= 150.0 + 600.0 * DT + 1e-9)
+        assert np.all(np.abs(engine.y) <= 80.0 + 600.0 * DT + 1e-9)
+
+
+@pytest.mark.parametrize("bounds", [(0.0, 0.0), (0.0, 100.0), (300.0, 200.0)])
+@pytest.mark.parametrize("speed", [0.0, 180.0, 5000.0])
+@pytest.mark.parametrize("pause", [0.0, 0.35])
+def test_advance_stays_in_bounds(bounds, speed, pause):
+    engine = seeded(200, 5, speed=speed, pause=pause)
+    engine.set_bounds(*bounds)
+    engine.start_random(engine.needs_movement())
+    for _ in range(20):
+        engine.advance(2.5)
+        assert np.all(np.abs(engine.x) <= bounds[0] + 1e-9)
+        assert np.all(np.abs(engine.y) <= bounds[1] + 1e-9)
+    assert engine.time == pytest.approx(50.0)
+
+
+def test_resize_keeps_existing_movers():
+    engine = seeded(10, 0)
+    engine.set_bounds(300.0, 200.0)
+    engine.start_random(engine.needs_movement())
+    for _ in range(200):
+        engine.step(DT)
+    x = engine.x.copy()
+    engine.resize(25)
+    np.testing.assert_array_equal(engine.x[:10], x)
+    assert np.all(engine.x[10:] == 0.0)
+    engine.resize(4)
+    np.testing.assert_array_equal(engine.x, x[:4])
@@ -0,0 +1,31 @@
+import io
+
+import numpy as np
+
+from export import export, simulate
+
+
+def test_blocks_cover_every_frame_whatever_the_chunk_size():
+    def run(chunk_frames):
+        blocks = list(simulate(20, 60, 400, 300, 24, count=3, seed=5, chunk_frames=chunk_frames))
+        assert [start for start, *_ in blocks] == list(range(0, 20, chunk_frames))
+        return [np.concatenate(arrays) for arrays in zip(*(b[1:] for b in blocks))]
+
+    whole = run(20)
+    for chunk_frames in (1, 3, 8):
+        for got, want in zip(run(chunk_frames), whole):
+            assert got.shape == (20, 3)
+            np.testing.assert_array_equal(got, want)
+
+
+def test_simulate_is_lazy():
+    blocks = simulate(10 ** 9, 60, 400, 300, 24, chunk_frames=4)
+    start, xs, _, _ = next(blocks)
+    assert start == 0 and xs.shape == (4, 1)
+
+
+def test_raw_export_writes_every_frame_in_order():
+    out = io.BytesIO()
+    export(5, 30, 32, 24, "circle", 8, "#00ffff", "#000000", raw=out, seed=1, workers=1,
+           chunk_frames=2)
+    assert len(out.getvalue()) == 5 * 32 * 24 * 3
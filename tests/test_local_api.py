@@ -0,0 +1,56 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from local_api import LocalApiServer
+
+
+def echo(query, body):
+    return 200, "text/plain", body
+
+
+@pytest.fixture
+def server():
+    server = LocalApiServer()
+    yield server
+    server.stop()
+
+
+def post(url, origin=None):
+    request = urllib.request.Request(url, data=b"hi", method="POST")
+    if origin:
+        request.add_header("Origin", origin)
+    with urllib.request.urlopen(request) as response:
+        return response.read(), response.headers
+
+
+def test_allowed_origin_is_echoed(server):
+    origins = {"http://localhost:8501"}
+    server.route("POST", "/echo", echo, allow_origin=origins)
+    server.start()
+    body, headers = post(server.base_url + "/echo", "http://localhost:8501")
+    assert body == b"hi"
+    assert headers["Access-Control-Allow-Origin"] == "http://localhost:8501"
+    assert headers["Vary"] == "Origin"
+
+    _, headers = post(server.base_url + "/echo", "http://evil.example")
+    assert "Access-Control-Allow-Origin" not in headers
+
+    # Origins added after start() take effect on the next request.
+    origins.add("http://evil.example")
+    _, headers = post(server.base_url + "/echo", "http://evil.example")
+    assert headers["Access-Control-Allow-Origin"] == "http://evil.example"
+
+
+def test_fixed_and_missing_origins(server):
+    server.route("POST", "/any", echo)
+    server.route("POST", "/none", echo, allow_origin=None)
+    server.start()
+    _, headers = post(server.base_url + "/any", "http://localhost:8501")
+    assert headers["Access-Control-Allow-Origin"] == "*"
+    _, headers = post(server.base_url + "/none", "http://localhost:8501")
+    assert "Access-Control-Allow-Origin" not in headers
+    with pytest.raises(urllib.error.HTTPError) as err:
+        post(server.base_url + "/missing")
+    assert err.value.code == 404
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from occupancy import OccupancyGrid
+
+
+def test_add_bins_positions_and_clamps_outliers():
+    grid = OccupancyGrid(50.0, 30.0, cell=10.0)
+    assert grid.shape == (6, 10)
+    grid.add(np.array([-49.0, 49.0, 0.0, 1000.0]), np.array([-29.0, 29.0, 0.0, -1000.0]))
+    assert grid.samples == 4
+    assert grid.counts[0, 0] == 1
+    assert grid.counts[5, 9] == 1
+    assert grid.counts[3, 5] == 1
+    # Outside the extent lands in the nearest edge cell.
+    assert grid.counts[0, 9] == 1
+
+
+def test_resize_rebins_without_losing_samples():
+    rng = np.random.default_rng(0)
+    grid = OccupancyGrid(100.0, 60.0, cell=10.0)
+    grid.add(rng.uniform(-100, 100, 5000), rng.uniform(-60, 60, 5000))
+    grid.resize(40.0, 25.0)
+    assert grid.shape == (5, 8)
+    assert grid.samples == pytest.approx(5000)
+    grid.resize(100.0, 60.0)
+    assert grid.samples == pytest.approx(5000)
+
+
+def test_merge_same_geometry_adds_counts():
+    a = OccupancyGrid(50.0, 50.0)
+    b = OccupancyGrid(50.0, 50.0)
+    a.add(0.0, 0.0)
+    b.add(0.0, 0.0)
+    b.add(20.0, -20.0)
+    a.merge(b)
+    assert a.samples == 3
+    assert a.counts.max() == 2
+
+
+def test_merge_rebins_other_geometry():
+    a = OccupancyGrid(50.0, 50.0, cell=10.0)
+    b = OccupancyGrid(100.0, 80.0, cell=5.0)
+    b.add(np.array([-12.0, 33.0, 90.0]), np.array([4.0, -44.0, 70.0]))
+    a.merge(b)
+    assert a.samples == 3
+    assert a.counts[5, 3] == 1
+    # The far corner is outside a's extent and folds into its corner cell.
+    assert a.counts[-1, -1] == 1
+
+
+def test_npz_round_trip(tmp_path):
+    grid = OccupancyGrid(70.0, 40.0, cell=7.0)
+    grid.add(np.array([1.0, -30.0]), np.array([2.0, 15.0]))
+    path = str(tmp_path / "grid.npz")
+    grid.save(path)
+    loaded = OccupancyGrid.load(path)
+    assert loaded.cell == 7.0
+    np.testing.assert_array_equal(loaded.counts, grid.counts)
+    assert loaded.summary() == grid.summary()
@@ -0,0 +1,64 @@
+import pytest
+
+from scheduler import SIM_STEP, FixedStepScheduler, StepAccumulator
+
+
+def test_accumulator_runs_whole_steps_and_keeps_the_remainder():
+    steps = StepAccumulator(step=0.01, max_steps=8)
+    calls = []
+    assert steps.run(0.035, calls.append) == 3
+    assert calls == [0.01] * 3
+    assert steps.pending == pytest.approx(0.005)
+    assert steps.run(0.006, calls.append) == 1
+    assert steps.pending == pytest.approx(0.001)
+    assert steps.dropped_time == 0.0
+
+
+def test_accumulator_drops_backlog_past_the_cap():
+    steps = StepAccumulator(step=0.01, max_steps=4)
+    calls = []
+    assert steps.run(1.0025, calls.append) == 4
+    assert steps.pending == pytest.approx(0.0025)
+    assert steps.dropped_time == pytest.approx(0.96)
+    steps.reset()
+    assert steps.pending == 0.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, fn):
+        self.pending.append(fn)
+        return len(self.pending)
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def test_scheduler_steps_by_elapsed_time():
+    clock = FakeClock()
+    widget = FakeWidget()
+    updates = []
+    frames = []
+    scheduler = FixedStepScheduler(widget, updates.append, lambda: frames.append(clock.now), clock=clock)
+    assert scheduler.step == SIM_STEP
+    scheduler.start()
+    for _ in range(3):
+        clock.now += 1.0 / 60.0
+        widget.pending.pop()()
+    assert len(frames) == 3
+    assert len(updates) == pytest.approx(6, abs=1)
+    # A long stall runs at most max_steps and drops the rest.
+    clock.now += 1.0
+    widget.pending.pop()()
+    assert scheduler.steps_last_frame == 8
+    assert scheduler.dropped_time > 0.9
@@ -0,0 +1,75 @@
+from settings import PendingSettings
+
+
+class FakeWidget:
+    """Records after() calls; the test fires them by hand."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self._next_id = 0
+
+    def after(self, ms, fn):
+        self._next_id += 1
+        self.scheduled[self._next_id] = fn
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        del self.scheduled[after_id]
+
+    def fire(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for fn in scheduled.values():
+            fn()
+
+
+def make(running=False, immediate=False):
+    widget = FakeWidget()
+    applied = []
+    redraws = []
+    settings = PendingSettings(widget, applied.append, lambda: running,
+                               lambda: redraws.append(1), immediate=immediate)
+    return widget, settings, applied, redraws
+
+
+def test_stopped_drag_coalesces_into_one_batch():
+    widget, settings, applied, redraws = make()
+    for v in range(100):
+        settings.set("size", v)
+    settings.set("color")
+    assert len(widget.scheduled) == 1
+    assert applied == []
+    widget.fire()
+    assert applied == [{"size": 99, "color": None}]
+    assert len(redraws) == 1
+    assert settings.received == 101
+    assert settings.batches == 1
+
+
+def test_running_waits_for_the_frame():
+    widget, settings, applied, redraws = make(running=True)
+    settings.set("speed", 1.0)
+    settings.set("speed", 2.0)
+    assert widget.scheduled == {}
+    assert settings.flush() is True
+    assert applied == [{"speed": 2.0}]
+    assert settings.flush() is False
+    # The frame does its own redraw.
+    assert redraws == []
+
+
+def test_flush_cancels_the_idle_timer():
+    widget, settings, applied, redraws = make()
+    settings.set("pause", 0.5)
+    assert settings.flush() is True
+    assert widget.scheduled == {}
+    settings.set("pause", 0.7)
+    assert len(widget.scheduled) == 1
+
+
+def test_immediate_mode_applies_every_change():
+    widget, settings, applied, redraws = make(immediate=True)
+    for v in range(5):
+        settings.set("size", v)
+    assert applied == [{"size": v} for v in range(5)]
+    assert len(redraws) == 5
+    assert widget.scheduled == {}
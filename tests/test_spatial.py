@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from engine import MotionEngine
+from spatial import Collider, SpatialHash, brute_force_pairs, separation
+
+
+def as_set(i, j):
+    return set(zip(np.minimum(i, j).tolist(), np.maximum(i, j).tolist()))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("count", [0, 1, 50, 2000])
+def test_pairs_match_brute_force(seed, count):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-400, 400, count)
+    y = rng.uniform(-300, 300, count)
+    grid = SpatialHash(20.0)
+    grid.rebuild(x, y)
+    i, j = grid.pairs(x, y, 20.0)
+    expected = as_set(*brute_force_pairs(x, y, 20.0)) if count else set()
+    assert as_set(i, j) == expected
+    # Each pair once.
+    assert len(i) == len(expected)
+
+
+def test_pairs_on_cell_boundaries():
+    x = np.array([0.0, 19.999, 20.0, -0.001, 40.0])
+    y = np.array([0.0, 0.0, 0.0, 0.0, 19.0])
+    grid = SpatialHash(20.0)
+    grid.rebuild(x, y)
+    assert as_set(*grid.pairs(x, y, 20.0)) == as_set(*brute_force_pairs(x, y, 20.0))
+
+
+def test_pile_up_is_capped_per_cell():
+    n = 500
+    x = np.zeros(n)
+    y = np.zeros(n)
+    grid = SpatialHash(20.0, max_per_cell=8)
+    grid.rebuild(x, y)
+    i, j = grid.pairs(x, y, 20.0)
+    pairs = as_set(i, j)
+    assert len(pairs) == len(i)
+    assert len(i) <= n * 8
+    # Every mover, capped or not, still has a partner to push against.
+    assert set(i.tolist()) | set(j.tolist()) == set(range(n))
+
+
+def test_separation_spreads_coincident_pairs():
+    i = np.arange(10)
+    j = i + 10
+    zero = np.zeros(10)
+    nx, ny = separation(zero, zero, zero, i, j)
+    np.testing.assert_allclose(np.hypot(nx, ny), 1.0)
+    assert len(np.unique(np.round(np.arctan2(ny, nx), 6))) == 10
+    nx, ny = separation(np.array([3.0]), np.array([4.0]), np.array([5.0]), i[:1], j[:1])
+    np.testing.assert_allclose([nx[0], ny[0]], [0.6, 0.8])
+
+
+def test_spread_then_bounce_separates_a_stack():
+    engine = MotionEngine(count=300, seed=0)
+    engine.set_bounds(500.0, 400.0)
+    collider = Collider(12.0)
+    collider.spread(engine)
+    assert np.all(np.abs(engine.x) <= engine.max_x)
+    assert len(np.unique(np.stack([engine.x, engine.y]), axis=1).T) == 300
+    collider.apply(engine)
+    assert collider.apply(engine) < 300
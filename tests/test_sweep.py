@@ -0,0 +1,63 @@
+import csv
+
+from sweep import FIELDS, build_grid, parse_args, read_done, sweep
+
+
+def grid(*extra):
+    return build_grid(parse_args(["--out", "unused.csv", "--screen", "400x300", "--seeds", "1",
+                                  "--seconds", "2", *extra]))
+
+
+def rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_build_grid_skips_inverted_distances():
+    runs = grid("--min-distance", "100", "700", "--max-distance", "600")
+    assert len(runs) == 1
+    assert runs[0]["min_distance"] == 100.0
+
+
+def test_resume_skips_finished_runs_and_redoes_a_cut_row(tmp_path):
+    out = str(tmp_path / "sweep.csv")
+    first = grid("--speed", "120", "240")
+    assert sweep(first, out, seconds=2, workers=1) == 2
+    assert len(rows(out)) == 2
+
+    # Interrupted mid-write: the last row is missing its metrics.
+    with open(out) as f:
+        text = f.read()
+    with open(out, "w") as f:
+        f.write(text[:text.rstrip("\n").rfind(",")])
+    assert len(read_done(out)) == 1
+    assert len(rows(out)) == 1
+
+    runs = grid("--speed", "120", "240", "360")
+    assert sweep(runs, out, seconds=2, workers=1) == 2
+    done = rows(out)
+    assert sorted(float(r["speed"]) for r in done) == [120.0, 240.0, 360.0]
+    assert all(r[k] != "" for r in done for k in FIELDS)
+
+    assert sweep(runs, out, seconds=2, workers=1) == 0
+    assert len(rows(out)) == 3
+
+
+def test_changed_duration_or_sample_rate_reruns_everything(tmp_path):
+    out = str(tmp_path / "sweep.csv")
+    runs = grid("--speed", "120")
+    assert sweep(runs, out, seconds=2, workers=1) == 1
+    assert sweep(runs, out, seconds=2, workers=1) == 0
+    assert sweep(runs, out, seconds=3, workers=1) == 1
+    assert sweep(runs, out, seconds=2, workers=1, sample_rate=10.0) == 1
+    assert sorted((float(r["seconds"]), float(r["sample_rate"])) for r in rows(out)) == [
+        (2.0, 10.0), (2.0, 30.0), (3.0, 30.0)]
+
+
+def test_journal_with_other_columns_is_started_afresh(tmp_path):
+    out = str(tmp_path / "sweep.csv")
+    with open(out, "w") as f:
+        f.write("width,height,speed\n400,300,120\n")
+    assert read_done(out) == set()
+    assert sweep(grid("--speed", "120"), out, seconds=2, workers=1) == 1
+    assert len(rows(out)) == 1
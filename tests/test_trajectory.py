@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from engine import MotionEngine
+from trajectory import (TrajectoryPlayer, TrajectoryRecorder, frame_dtype, open_frames, open_segments,
+                        read_header)
+
+DT = 1.0 / 60.0
+
+
+def record(path, count=20, steps=300, seed=11, block_bytes=4096):
+    engine = MotionEngine(count=count, speed=240.0, pause=0.1, seed=seed)
+    engine.set_bounds(300.0, 200.0)
+    engine.start_random(engine.needs_movement())
+    recorder = TrajectoryRecorder(path, count, sample_interval=DT, seed=seed, block_bytes=block_bytes)
+    frames = []
+    for _ in range(steps):
+        engine.step(DT)
+        recorder.capture(engine)
+        frames.append((engine.x.copy(), engine.y.copy()))
+    recorder.close()
+    return frames
+
+
+def test_round_trip_reproduces_positions(tmp_path):
+    path = str(tmp_path / "run.trj")
+    frames = record(path)
+    assert read_header(path) == (20, DT, 11)
+
+    player = TrajectoryPlayer(path)
+    assert len(player) == len(frames)
+    x = np.zeros(20)
+    y = np.zeros(20)
+    for k in (0, 1, 57, len(frames) - 1):
+        player.positions_at(k * DT, x, y)
+        np.testing.assert_allclose(x, frames[k][0], atol=1e-3)
+        np.testing.assert_allclose(y, frames[k][1], atol=1e-3)
+
+
+def test_playback_interpolates_between_samples(tmp_path):
+    path = str(tmp_path / "run.trj")
+    frames = record(path)
+    player = TrajectoryPlayer(path)
+    x = np.zeros(20)
+    y = np.zeros(20)
+    player.positions_at(10.5 * DT, x, y)
+    np.testing.assert_allclose(x, (frames[10][0] + frames[11][0]) / 2, atol=1e-3)
+
+
+def test_frames_have_a_fixed_size(tmp_path):
+    path = str(tmp_path / "run.trj")
+    record(path, count=7, steps=50)
+    frames = open_frames(path)
+    assert frames.dtype == frame_dtype(7)
+    assert frames.dtype.itemsize == 8 + 7 * 8
+    np.testing.assert_allclose(frames["t"], np.arange(1, 51) * DT)
+
+
+def test_irregular_frames_are_found_by_search(tmp_path):
+    path = str(tmp_path / "run.trj")
+    engine = MotionEngine(count=3, seed=0)
+    engine.set_bounds(300.0, 200.0)
+    recorder = TrajectoryRecorder(path, 3, sample_interval=DT, seed=0)
+    for t in (0.0, 0.5, 0.51, 2.0):
+        engine.time = t
+        engine.x[:] = t
+        recorder.capture(engine)
+    recorder.close()
+    player = TrajectoryPlayer(path)
+    x = np.zeros(3)
+    y = np.zeros(3)
+    player.positions_at(1.25, x, y)
+    np.testing.assert_allclose(x, 1.25, atol=1e-6)
+
+
+def test_segments_are_recorded_once_each(tmp_path):
+    path = str(tmp_path / "run.trj")
+    record(path)
+    segments = open_segments(path)
+    assert len(segments) > 20
+    # No mover starts two segments at the same instant.
+    keys = set(zip(segments["mover"].tolist(), segments["t"].tolist()))
+    assert len(keys) == len(segments)
+
+
+def test_empty_recording(tmp_path):
+    path = str(tmp_path / "run.trj")
+    TrajectoryRecorder(path, 5).close()
+    player = TrajectoryPlayer(path)
+    assert len(player) == 0
+    assert player.duration == 0.0
+    x = np.ones(5)
+    player.positions_at(1.0, x, x)
+    assert np.all(x == 1.0)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.trj"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        read_header(str(path))
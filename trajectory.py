@@ -0,0 +1,203 @@
+"""
+Compact binary trajectory recording and replay.
+A recording is a fixed 32-byte header followed by fixed-size frames, one per
+sample: a float64 timestamp and a float32 (x, y) pair for every mover. Segment
+records (pause start, angle, distance) go to a ``.segments`` file next to it.
+Both are buffered in blocks and streamed to disk, and a finished recording is
+memory-mapped for playback without any RNG or simulation; frame k sits at a
+fixed offset, so playback reads only the frames it needs.
+"""
+
+import bisect
+import struct
+
+import numpy as np
+
+MAGIC = b"RDOTTRJ2"
+HEADER = struct.Struct("<8sIIdq")
+HEADER_SIZE = HEADER.size
+
+SEGMENT_DTYPE = np.dtype([
+    ("mover", "<u4"),
+    ("t", "<f8"),
+    ("angle", "<f4"),
+    ("distance", "<f4"),
+], align=False)
+
+BLOCK_BYTES = 1 << 20
+SAMPLE_INTERVAL = 1.0 / 60.0
+NO_SEED = -1
+
+
+def frame_dtype(count):
+    """One sample: its time and every mover's (x, y)."""
+    return np.dtype([("t", "<f8"), ("xy", "<f4", (int(count), 2))], align=False)
+
+
+def segments_path(path):
+    return path + ".segments"
+
+
+class TrajectoryRecorder:
+    """Streams position frames and segments from a MotionEngine to disk."""
+
+    def __init__(self, path, count, sample_interval=SAMPLE_INTERVAL, seed=None,
+                 block_bytes=BLOCK_BYTES):
+        self.path = path
+        self.count = int(count)
+        self.sample_interval = float(sample_interval)
+        dtype = frame_dtype(self.count)
+        self.frames = np.zeros(max(1, block_bytes // dtype.itemsize), dtype=dtype)
+        self.segments = np.zeros(max(1, block_bytes // SEGMENT_DTYPE.itemsize), dtype=SEGMENT_DTYPE)
+        self.frame_fill = 0
+        self.segment_fill = 0
+        self.written = 0
+        self._next_sample = None
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, self.count, 0, self.sample_interval,
+                                     NO_SEED if seed is None else int(seed)))
+        self._segment_file = open(segments_path(path), "wb")
+
+    def capture(self, engine):
+        """Record what changed during the engine's last step."""
+        started = engine.segment_started[:self.count]
+        idx = np.flatnonzero(started)
+        if len(idx):
+            self._segments(engine, idx)
+            engine.segment_started[:] = False
+
+        if self._next_sample is None:
+            self._next_sample = engine.time
+        if engine.time + 1e-9 >= self._next_sample:
+            self._sample(engine)
+            self._next_sample += self.sample_interval
+            if self._next_sample <= engine.time:
+                self._next_sample = engine.time + self.sample_interval
+
+    def _segments(self, engine, idx):
+        if self.segment_fill + len(idx) > len(self.segments):
+            self._flush_segments()
+        if len(idx) > len(self.segments):
+            self.segments = np.zeros(len(idx), dtype=SEGMENT_DTYPE)
+        rec = self.segments[self.segment_fill:self.segment_fill + len(idx)]
+        self.segment_fill += len(idx)
+        rec["mover"] = idx
+        rec["t"] = engine.time
+        rec["angle"] = engine.heading[idx]
+        rec["distance"] = engine.remaining[idx]
+
+    def _sample(self, engine):
+        if self.frame_fill == len(self.frames):
+            self._flush_frames()
+        k = self.frame_fill
+        self.frame_fill += 1
+        n = min(engine.count, self.count)
+        self.frames["t"][k] = engine.time
+        xy = self.frames["xy"][k]
+        xy[:n, 0] = engine.x[:n]
+        xy[:n, 1] = engine.y[:n]
+        # Movers removed mid-recording are written as gaps.
+        xy[n:] = np.nan
+
+    def _flush_frames(self):
+        if self.frame_fill:
+            self._file.write(self.frames[:self.frame_fill].tobytes())
+            self.written += self.frame_fill
+            self.frame_fill = 0
+
+    def _flush_segments(self):
+        if self.segment_fill:
+            self._segment_file.write(self.segments[:self.segment_fill].tobytes())
+            self.segment_fill = 0
+
+    def flush(self):
+        self._flush_frames()
+        self._flush_segments()
+        self._file.flush()
+        self._segment_file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        self._segment_file.close()
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        magic, count, _, sample_interval, seed = HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a trajectory recording")
+    return count, sample_interval, (None if seed == NO_SEED else seed)
+
+
+def _memmap(path, dtype, offset=0):
+    # np.memmap refuses empty files; a recording without frames or segments is still valid.
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        n = (f.tell() - offset) // dtype.itemsize
+    if n <= 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(n,))
+
+
+def open_frames(path):
+    """Memory-map every complete frame in a recording."""
+    count, _, _ = read_header(path)
+    return _memmap(path, frame_dtype(count), HEADER_SIZE)
+
+
+def open_segments(path):
+    """Memory-map the segment records written alongside a recording."""
+    return _memmap(segments_path(path), SEGMENT_DTYPE)
+
+
+class TrajectoryPlayer:
+    """Looks up interpolated positions from a recording by playback time."""
+
+    def __init__(self, path):
+        self.count, self.sample_interval, self.seed = read_header(path)
+        self.frames = open_frames(path)
+        self.segments = open_segments(path)
+        # A strided view of every frame's timestamp; indexing it reads one frame.
+        self._times = self.frames["t"]
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duration(self):
+        return float(self._times[-1] - self._times[0]) if len(self.frames) else 0.0
+
+    def _frame_before(self, t):
+        """Index of the last frame at or before absolute time ``t``."""
+        times = self._times
+        last = len(times) - 1
+        # Frames are one sample interval apart, so the guess is almost always right.
+        k = int((t - times[0]) / self.sample_interval) if self.sample_interval > 0 else 0
+        k = min(max(k, 0), last)
+        if times[k] <= t and (k == last or times[k + 1] > t):
+            return k
+        return min(max(bisect.bisect_right(times, t) - 1, 0), last)
+
+    def positions_at(self, t, out_x, out_y):
+        """Write positions at ``t`` seconds into the recording into the out arrays."""
+        if len(self.frames) == 0:
+            return
+        times = self._times
+        t = times[0] + t
+        k = self._frame_before(t)
+        xy = self.frames["xy"][k]
+        x0, y0 = xy[:, 0], xy[:, 1]
+        if k + 1 < len(self.frames):
+            span = times[k + 1] - times[k]
+            w = (t - times[k]) / span if span > 0 else 0.0
+            w = min(max(w, 0.0), 1.0)
+            nxt = self.frames["xy"][k + 1]
+            x0 = x0 + (nxt[:, 0] - x0) * w
+            y0 = y0 + (nxt[:, 1] - y0) * w
+        n = min(len(out_x), self.count)
+        live = np.isfinite(x0[:n])
+        out_x[:n][live] = x0[:n][live]
+        out_y[:n][live] = y0[:n][live]
@@ -0,0 +1,135 @@
+"""
+Python-authoritative trajectories for the p5 sketch.
+MotionEngine (main.py's motion model, including redirect-to-center) is run in
+bulk to produce each mover's turn points, which are shipped to the browser as
+packed float32 chunks. The sketch only walks straight lines between turn
+points at its own speed and pause settings, with no RNG or edge logic.
+"""
+
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+from engine import MotionEngine, playfield_bounds
+
+GEN_SPEED = 600.0
+GEN_STEP = 1.0 / 60.0
+MAX_GEN_STEPS = 200000
+MAX_SESSIONS = 16
+MAX_NEED = 256
+MAX_MOVERS = 10000  # the sketch's MAX_MOVERS
+
+
+class WaypointGenerator:
+    """Per-session engine plus turn points generated ahead of what was asked for."""
+
+    def __init__(self, count, width, height, size=24, seed=None):
+        # Pauses are applied by the renderer; generation only needs the geometry.
+        self.engine = MotionEngine(count=count, speed=GEN_SPEED, pause=0.0, seed=seed)
+        self._idx = np.zeros(0, dtype=np.int64)
+        self._xy = np.zeros((0, 2), dtype=np.float32)
+        self.set_bounds(width, height, size)
+
+    def set_bounds(self, width, height, size=24):
+        self.engine.set_bounds(*playfield_bounds(width, height, size))
+        # Points generated ahead for the old size must land inside the new one.
+        np.clip(self._xy[:, 0], -self.engine.max_x, self.engine.max_x, out=self._xy[:, 0])
+        np.clip(self._xy[:, 1], -self.engine.max_y, self.engine.max_y, out=self._xy[:, 1])
+
+    def _collect(self, need):
+        """Step the engine until every mover has at least ``need`` turn points buffered."""
+        engine = self.engine
+        have = np.bincount(self._idx, minlength=engine.count)
+        idx_parts = [self._idx]
+        xy_parts = [self._xy]
+        steps = 0
+        while np.any(have < need) and steps < MAX_GEN_STEPS:
+            engine.step(GEN_STEP)
+            steps += 1
+            started = np.flatnonzero(engine.segment_started)
+            if len(started) == 0:
+                continue
+            engine.segment_started[:] = False
+            idx_parts.append(started)
+            # Coarse generation steps overshoot walls slightly; the renderer never clamps.
+            xy = np.column_stack((np.clip(engine.x[started], -engine.max_x, engine.max_x),
+                                  np.clip(engine.y[started], -engine.max_y, engine.max_y)))
+            xy_parts.append(xy.astype(np.float32))
+            have += np.bincount(started, minlength=engine.count)
+        self._idx = np.concatenate(idx_parts)
+        self._xy = np.concatenate(xy_parts)
+        if np.any(have < need):
+            raise ValueError("engine produced too few turn points")
+
+    def take(self, need):
+        """Return ``need[i]`` turn points per mover, mover-major, as float32 (x, y) pairs.
+
+        Coordinates are relative to the canvas centre with y pointing up. A mover's
+        first point is where it starts, so the renderer travels from each point to
+        the next.
+        """
+        need = np.asarray(need, dtype=np.int64)
+        if len(need) > MAX_MOVERS:
+            raise ValueError(f"at most {MAX_MOVERS} movers per request")
+        if need.max(initial=0) > MAX_NEED:
+            raise ValueError(f"at most {MAX_NEED} turn points per mover per request")
+        if len(need) != self.engine.count:
+            self.engine.resize(len(need))
+            keep = self._idx < len(need)
+            self._idx, self._xy = self._idx[keep], self._xy[keep]
+        self._collect(need)
+
+        # Stable sort keeps each mover's points in generation order.
+        order = np.argsort(self._idx, kind="stable")
+        idx = self._idx[order]
+        xy = self._xy[order]
+        counts = np.bincount(idx, minlength=len(need))
+        first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        rank = np.arange(len(idx)) - first[idx]
+        sent = rank < need[idx]
+
+        self._idx, self._xy = idx[~sent], xy[~sent]
+        return xy[sent]
+
+
+class WaypointService:
+    """Keeps a bounded set of per-browser-session generators."""
+
+    def __init__(self, max_sessions=MAX_SESSIONS):
+        self.sessions = OrderedDict()
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+
+    def chunk(self, session, need, width, height, size, seed=None):
+        with self._lock:
+            gen = self.sessions.pop(session, None)
+            if gen is None:
+                gen = WaypointGenerator(len(need), width, height, size, seed=seed)
+            else:
+                gen.set_bounds(width, height, size)
+            self.sessions[session] = gen
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+            return gen.take(need)
+
+
+def waypoint_route(service):
+    """local_api route: POST a Uint16Array of per-mover needs, receive packed float32 points."""
+    def handle(query, body):
+        need = np.frombuffer(body, dtype="<u2")
+        if len(need) == 0:
+            raise ValueError("empty need vector")
+        if len(need) > MAX_MOVERS:
+            raise ValueError(f"at most {MAX_MOVERS} movers per request")
+        seed = query.get("seed")
+        points = service.chunk(
+            str(query["session"])[:64],
+            need,
+            float(query["width"]),
+            float(query["height"]),
+            float(query.get("size", 24)),
+            seed=int(seed) if seed else None,
+        )
+        return 200, "application/octet-stream", points.astype("<f4").tobytes()
+    return handle
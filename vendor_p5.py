@@ -0,0 +1,31 @@
+"""
+Downloads the pinned p5.js build into static/ so the Streamlit app can run
+without network access. The app refuses to start without it; run this once on
+a connected machine and commit the file (its license is static/p5.LICENSE.txt).
+"""
+
+import os
+import sys
+import urllib.request
+
+P5_VERSION = "1.6.0"
+P5_URL = f"https://cdnjs.cloudflare.com/ajax/libs/p5.js/{P5_VERSION}/p5.min.js"
+P5_LOCAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "p5.min.js")
+
+
+def main():
+    os.makedirs(os.path.dirname(P5_LOCAL_PATH), exist_ok=True)
+    with urllib.request.urlopen(P5_URL, timeout=30) as resp:
+        data = resp.read()
+    # Every p5 build starts with a "/*! p5.js vX.Y.Z" banner.
+    if f"p5.js v{P5_VERSION}".encode() not in data[:256]:
+        sys.exit(f"Unexpected response from {P5_URL}")
+    tmp = P5_LOCAL_PATH + ".part"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, P5_LOCAL_PATH)
+    print(f"Saved p5.js {P5_VERSION} ({len(data)} bytes) to {P5_LOCAL_PATH}")
+
+
+if __name__ == "__main__":
+    main()